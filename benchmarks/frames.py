@@ -0,0 +1,209 @@
+"""Deterministic frame benchmark for the engine hot paths.
+
+Runs a scripted scene with UFOs, projectiles and a starfield on a headless
+game, timing each phase of the simulation and drawing, and prints the
+results as JSON. Objects removed from the scene are replaced every frame,
+and the time spent spawning them is reported as the 'spawn' phase.
+
+Usage: python -m benchmarks.frames [options]
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+
+# keep stdout clean for the JSON results.
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame  # noqa: E402
+
+from engine import (Game, Command, SceneBehavior,  # noqa: E402
+                    SceneObject, RandomInt, Direction)
+from engine.profiler import percentile  # noqa: E402
+
+
+PHASES = ("spawn", "frame", "collisions", "update", "draw")
+
+
+def create_script(options):
+    """Return the game configuration for the benchmark."""
+    width, height = options.size
+    return {
+        "fps": 60,
+        "window": {
+            "size": "minimum",
+            "minimum": (width, height),
+            "maximum": (width, height),
+        }
+    }
+
+
+def create_scene(options, canvas_size):
+    """Return the benchmark scene configuration."""
+    width, height = canvas_size
+
+    def position():
+        return (random.randint(0, width), random.randint(50, height - 50))
+
+    def direction():
+        return random.choice([Direction.right, Direction.left,
+                              Direction.up, Direction.down])
+
+    pool = {"pool": options.pool} if options.pool > 0 else {}
+    collision = {"broadphase": options.broadphase,
+                 "layers": ["player_shot", "enemy"]}
+    if options.batch_threshold is not None:
+        collision["batch_threshold"] = options.batch_threshold
+    return {
+        "name": "benchmark",
+        "collision": collision,
+        "behaviors": {
+            "ufo_controller": {
+                "class": "engine.controllers.ConstantController",
+                "init": {"dx": RandomInt(1, 3), "dy": 0}
+            },
+        },
+        "objects": {
+            "background": {
+                "class": "objects.starfield.Starfield",
+                "init": {"canvas_size": canvas_size, "count": options.stars}
+            },
+            "ufo": {
+                **pool,
+                "class": "objects.enemy.KillableEnemy",
+                "init": {
+                    "canvas": canvas_size,
+                    "image": 'media/images/ufo_spin.gif',
+                    "controller": SceneBehavior("ufo_controller"),
+                    "position": Command(position),
+                    "animate": True,
+                    "shadow": ((30, 20), 0.8, 0.5),
+                    "bounding_shape": "ellipse",
+                },
+                "collision": {"category": "enemy", "mask": ["player_shot"]}
+            },
+            "projectile": {
+                **pool,
+                "class": "objects.projectile.Projectile",
+                "init": {
+                    "creator": SceneObject("background"),
+                    "color": (255, 0, 255),
+                    "origin": Command(position),
+                    "direction": Command(direction),
+                    "size": 12
+                },
+                "collision": {"category": "player_shot", "mask": ["enemy"]}
+            },
+        },
+        "before": [("spawn", "background")],
+    }
+
+
+def fill(scene, name, count):
+    """Spawn objects until there are count objects with the given name."""
+    missing = count - len(scene.get_object_list(name))
+    for _ in range(missing):
+        scene.event("spawn", name)
+
+
+def summary(values):
+    """Summarize a list of timings, in miliseconds."""
+    return {
+        "total": sum(values),
+        "mean": sum(values) / len(values) if values else 0,
+        "p50": percentile(values, 50),
+        "p95": percentile(values, 95),
+        "max": max(values) if values else 0,
+    }
+
+
+def run(options):
+    """Run the benchmark, returning the results."""
+    random.seed(options.seed)
+    game = Game(create_script(options), headless=True)
+    game.add_scene(create_scene(options, game.window.size))
+    game.start("benchmark")
+    scene = game.current_scene
+    window = game.window
+    step = 1000 / 60
+    timings = {phase: [] for phase in PHASES}
+    objects = []
+    clock = time.perf_counter
+    for frame in range(options.warmup + options.frames):
+        start = clock()
+        fill(scene, "ufo", options.ufos)
+        fill(scene, "projectile", options.projectiles)
+        t0 = clock()
+        scene.frame(frame, step)
+        t1 = clock()
+        scene.verify_collisions()
+        t2 = clock()
+        scene.update_objects(window.bounds)
+        t3 = clock()
+        window.clear()
+        scene.draw(window)
+        t4 = clock()
+        if frame < options.warmup:
+            continue
+        marks = (start, t0, t1, t2, t3, t4)
+        for phase, begin, end in zip(PHASES, marks, marks[1:]):
+            timings[phase].append((end - begin) * 1000)
+        objects.append(sum(len(scene.get_object_list(name))
+                           for name in ("ufo", "projectile")))
+    totals = [sum(t) for t in zip(*timings.values())]
+    return {
+        "config": vars(options),
+        "platform": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+        },
+        "phases": {phase: summary(timings[phase]) for phase in PHASES},
+        "frame_total": summary(totals),
+        "objects": sum(objects) / len(objects) if objects else 0,
+    }
+
+
+def parse_options(args=None):
+    """Process benchmark command line options."""
+    parser = argparse.ArgumentParser(description="Genesis frame benchmark")
+    parser.add_argument("--ufos", type=int, default=200,
+                        help="Number of UFOs kept in the scene.")
+    parser.add_argument("--projectiles", type=int, default=100,
+                        help="Number of projectiles kept in the scene.")
+    parser.add_argument("--stars", type=int, default=300,
+                        help="Number of stars in the starfield.")
+    parser.add_argument("--frames", type=int, default=600,
+                        help="Number of measured frames.")
+    parser.add_argument("--warmup", type=int, default=60,
+                        help="Number of frames run before measuring.")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="Seed for the random number generator.")
+    parser.add_argument("--size", type=int, nargs=2, default=(1024, 768),
+                        metavar=("W", "H"), help="Window size.")
+    parser.add_argument("--broadphase", default="grid",
+                        help="Collision broad phase (pairwise, grid, sap).")
+    parser.add_argument("--batch-threshold", type=int, default=None,
+                        dest="batch_threshold",
+                        help="Minimum pairs for the vectorized narrow phase.")
+    parser.add_argument("--pool", type=int, default=0,
+                        help="Pool size for UFOs and projectiles.")
+    parser.add_argument("-o", "--output", default=None,
+                        help="Write JSON results to file instead of stdout.")
+    return parser.parse_args(args)
+
+
+if __name__ == "__main__":
+    pygame.init()
+    options = parse_options()
+    output = options.output
+    results = run(options)
+    if output is None:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+    else:
+        with open(output, "w") as out:
+            json.dump(results, out, indent=2)
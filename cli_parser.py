@@ -14,5 +14,16 @@ def proccess_CLI():
     msg = 'Use the given dimension instead of the highest one.'
     parser.add_argument("-s", "--size", action='store', dest="dimension",
                         metavar="DIM", nargs=2, type=int, help=msg)
+    msg = 'Simulate the game without window or sound, as fast as possible.'
+    parser.add_argument("--headless", action='store_true', dest='headless',
+                        help=msg)
+    msg = 'Stop after simulating the given number of frames.'
+    parser.add_argument("-f", "--frames", action='store', dest='frames',
+                        metavar="N", type=int, help=msg)
+    msg = 'Show frame rate and frame time statistics on screen.'
+    parser.add_argument("--stats", action='store_true', dest='stats',
+                        help=msg)
+    parser.add_argument("--scene", action='store', dest='scene',
+                        default='intro', help='Start at the given scene.')
 
     return parser.parse_args()
@@ -12,6 +12,7 @@ from .gameobject import GameObject   # noqa: F401
 from .sprite import Sprite   # noqa: F401
 from .scene import (Scene, SceneEvent,   # noqa: F401
     SceneObject, SceneBehavior)  # noqa: F401
+from .profiler import Profiler   # noqa: F401
 from .text import Label, Font   # noqa: F401
 from .window import Window   # noqa: F401
 
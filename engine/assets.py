@@ -0,0 +1,108 @@
+"""Cache of images converted to the display pixel format, and sounds.
+
+Surfaces that are not in the display format are converted on every blit.
+Images loaded here are converted once, after the window is created, and
+shared by every object using the same file with the same transformation.
+Loaded files are kept until the cache is cleared, but only the most
+recently used transformed images are kept, as objects may be created with
+random scales and rotations.
+"""
+
+from .lib.shadows import add_shadow
+
+from collections import OrderedDict
+from threading import Lock
+import pygame
+
+
+# number of transformed images, and masks, kept in the cache.
+CACHE_SIZE = 64
+
+# surfaces by filename
+__images = {}
+# transformed surfaces and masks, least recently used first
+__transformed = OrderedDict()
+# images are loaded by the preloader threads too.
+__lock = Lock()
+# sounds by filename
+__sounds = {}
+
+
+def convert(surface):
+    """Convert a surface to the display format, keeping transparency.
+
+    Before the display is created, the surface is returned unchanged.
+    """
+    if pygame.display.get_surface() is None:
+        return surface
+    if surface.get_flags() & pygame.SRCALPHA:
+        return surface.convert_alpha()
+    return surface.convert()
+
+
+def load_image(filename):
+    """Return an image file, loaded once."""
+    image = __images.get(filename)
+    if image is None:
+        image = convert(pygame.image.load(filename))
+        # only keep surfaces that could be converted.
+        if pygame.display.get_surface() is not None:
+            __images[filename] = image
+    return image
+
+
+def __cached(key, create):
+    with __lock:
+        value = __transformed.get(key)
+        if value is not None:
+            __transformed.move_to_end(key)
+            return value
+    value = create()
+    if pygame.display.get_surface() is not None:
+        with __lock:
+            __transformed[key] = value
+            if len(__transformed) > CACHE_SIZE:
+                __transformed.popitem(last=False)
+    return value
+
+
+def get_image(filename, scale=1, rotation=0, shadow=None):
+    """Return an image, rotated, scaled and with a shadow, if given.
+
+    The shadow is given as (offset, scale, ambience), the same parameters
+    of lib.shadows.add_shadow.
+    """
+    if shadow is not None:
+        def create():
+            image = get_image(filename, scale, rotation)
+            offset, shadow_scale, ambience = shadow
+            return convert(add_shadow(image, offset, shadow_scale=shadow_scale,
+                                      ambience=ambience))
+    else:
+        def create():
+            image = load_image(filename)
+            return convert(pygame.transform.rotozoom(image, rotation, scale))
+    return __cached((filename, scale, rotation, shadow), create)
+
+
+def get_mask(filename, scale=1, rotation=0):
+    """Return the collision mask of a rotated and scaled image."""
+    def create():
+        return pygame.mask.from_surface(get_image(filename, scale, rotation))
+    return __cached(('mask', filename, scale, rotation), create)
+
+
+def load_sound(filename):
+    """Return a sound file, loaded once."""
+    sound = __sounds.get(filename)
+    if sound is None:
+        sound = __sounds[filename] = pygame.mixer.Sound(filename)
+    return sound
+
+
+def clear_cache():
+    """Release every cached image and sound."""
+    __images.clear()
+    with __lock:
+        __transformed.clear()
+    __sounds.clear()
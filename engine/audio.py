@@ -1,7 +1,8 @@
 """Audio functions."""
 
+from .assets import load_sound
+
 import pygame
-pygame.mixer.init()
 
 
 class Mixer:
@@ -9,6 +10,8 @@ class Mixer:
 
     def __init__(self, config={}):
         """Initialize mixer."""
+        if not pygame.mixer.get_init():
+            pygame.mixer.init()
         self.__loops = {}
         self.__mute = config.get('mute', False)
 
@@ -18,7 +21,7 @@ class Mixer:
 
     def add(self, name, filename):
         """Set an audio file."""
-        self.__loops[name] = pygame.mixer.Sound(filename)
+        self.__loops[name] = load_sound(filename)
 
     def play_loop(self, name):
         """Play an audio file."""
@@ -48,15 +48,38 @@ class Hideable:
 class Movable:
     """Define a movable object."""
 
+    # Fraction of a simulation step between the last simulated state and
+    # the time an object is drawn. Set by the game loop when interpolating.
+    interpolation = 1
+
     def __init__(self, position):
         """Initialize the object."""
         self.__position = position
+        self.__previous = position
 
     @property
     def position(self):
         """Return the current position."""
         return self.__position
 
+    @property
+    def render_position(self):
+        """Return the position to draw the object."""
+        alpha = Movable.interpolation
+        if alpha >= 1:
+            return self.__position
+        return tuple(p + (c - p) * alpha
+                     for p, c in zip(self.__previous, self.__position))
+
+    def save_position(self):
+        """Save the position before a simulation step."""
+        self.__previous = self.__position
+
     def move(self, dx, dy):
         """Move object."""
         self.__position = tuple(map(operator.add, self.position, (dx, dy)))
+        self.moved()
+
+    def moved(self):
+        """Notify the object that its position has changed."""
+        pass
@@ -0,0 +1,117 @@
+"""Broad phase algorithms for collision detection.
+
+A broad phase receives the list of colliders of a scene and returns the
+pairs of indexes (i, j), with i < j, that might collide. Only those pairs
+are handed to the narrow phase (Collider.did_collide), so the cost of a
+frame depends on how close objects are instead of how many they are.
+"""
+
+from itertools import combinations
+from math import floor
+
+
+class BroadPhase:
+    """Define the interface of a collision broad phase."""
+
+    def pairs(self, colliders):
+        """Return the sorted candidate pairs of indexes, (i, j) with i < j."""
+        raise NotImplementedError("Subclasses must implement pairs().")
+
+
+class Pairwise(BroadPhase):
+    """Test every object against every other object."""
+
+    def pairs(self, colliders):
+        """Return every pair of colliders."""
+        return combinations(range(len(colliders)), 2)
+
+
+class SpatialHash(BroadPhase):
+    """Uniform grid, storing objects in every cell their box touches."""
+
+    def __init__(self, cell_size=64):
+        """Initialize the grid with the given cell size, in pixels."""
+        self.__cell_size = cell_size
+
+    def pairs(self, colliders):
+        """Return pairs of colliders that share at least one cell."""
+        cs = self.__cell_size
+        grid = {}
+        for i, obj in enumerate(colliders):
+            x, y, w, h = obj.aabb
+            x0, y0 = floor(x / cs), floor(y / cs)
+            x1, y1 = floor((x + w) / cs), floor((y + h) / cs)
+            for cx in range(x0, x1 + 1):
+                for cy in range(y0, y1 + 1):
+                    cell = grid.get((cx, cy))
+                    if cell is None:
+                        grid[(cx, cy)] = [i]
+                    else:
+                        cell.append(i)
+        candidates = set()
+        for cell in grid.values():
+            if len(cell) > 1:
+                candidates.update(combinations(cell, 2))
+        return sorted(candidates)
+
+
+class SweepAndPrune(BroadPhase):
+    """Sweep and prune on the x axis, keeping objects sorted across frames.
+
+    As objects move little between frames, the list kept from the previous
+    frame is almost sorted, and an insertion sort restores the order in
+    nearly linear time.
+    """
+
+    def __init__(self):
+        """Initialize the sorted axis list."""
+        self.__order = []
+
+    def pairs(self, colliders):
+        """Return pairs of colliders whose boxes overlap."""
+        index = {id(obj): i for i, obj in enumerate(colliders)}
+        # keep the previous order, dropping objects no longer in the scene.
+        order = [index.pop(id(obj)) for obj in self.__order
+                 if id(obj) in index]
+        order.extend(sorted(index.values()))
+        axis = []
+        for i in order:
+            x, y, w, h = colliders[i].aabb
+            axis.append((x, x + w, y, y + h, i))
+        # insertion sort on the minimum x.
+        for k in range(1, len(axis)):
+            entry = axis[k]
+            j = k - 1
+            while j >= 0 and axis[j][0] > entry[0]:
+                axis[j + 1] = axis[j]
+                j -= 1
+            axis[j + 1] = entry
+        self.__order = [colliders[e[-1]] for e in axis]
+        # sweep the axis, keeping the boxes that still overlap in x.
+        candidates = []
+        active = []
+        for x0, x1, y0, y1, i in axis:
+            active = [a for a in active if a[0] >= x0]
+            for _, ay0, ay1, j in active:
+                if ay0 <= y1 and y0 <= ay1:
+                    candidates.append((i, j) if i < j else (j, i))
+            active.append((x1, y0, y1, i))
+        candidates.sort()
+        return candidates
+
+
+__broadphases = {
+    "pairwise": lambda config: Pairwise(),
+    "grid": lambda config: SpatialHash(config.get('cell_size', 64)),
+    "sap": lambda config: SweepAndPrune(),
+}
+
+
+def create_broadphase(config):
+    """Create a broad phase from a scene 'collision' configuration."""
+    name = config.get('broadphase', 'grid')
+    try:
+        factory = __broadphases[name]
+    except KeyError as e:
+        raise Exception("Unknown broad phase: {}".format(name)) from e
+    return factory(config)
@@ -1,6 +1,10 @@
 """Algoritms for collision detection."""
 
-from math import copysign, sin, cos, pi
+from functools import lru_cache
+from math import copysign, sin, cos, pi, sqrt, floor
+
+import numpy as np
+import pygame
 
 
 def sign(x):
@@ -13,18 +17,45 @@ class Collider:
 
     class __Algo:
         @staticmethod
-        def __distance_to_ellipse(ellipse, point):
-            x, y = point
-            h, k, rx, ry, a = ellipse
+        def __ellipse_axes(ellipse):
+            """Return the center, semi-axes and rotation of an ellipse."""
+            h, k, rx, ry, a, *rotation = ellipse
             rx, ry = (rx // 2, ry // 2) if rx <= ry else (ry // 2, rx // 2)
-            rad = -1 * a * pi / 180
-            sina = sin(rad)
-            cosa = cos(rad)
+            if rotation:
+                sina, cosa = rotation
+            else:
+                sina, cosa = Collider.rotation_terms(a)
+            return (h, k, rx, ry, sina, cosa)
+
+        @classmethod
+        def __to_ellipse_frame(cls, ellipse, point):
+            """Map point to the frame where the ellipse is a unit circle."""
+            x, y = point
+            h, k, rx, ry, sina, cosa = cls.__ellipse_axes(ellipse)
             xh = x - h
             yk = y - k
             t1 = xh * cosa - yk * sina
             t2 = xh * sina + yk * cosa
-            return ((t1 * t1) / (rx * rx)) + ((t2 * t2) / (ry * ry))
+            return (t1 / rx, t2 / ry)
+
+        @classmethod
+        def __distance_to_ellipse(cls, ellipse, point):
+            t1, t2 = cls.__to_ellipse_frame(ellipse, point)
+            return t1 * t1 + t2 * t2
+
+        @staticmethod
+        def __distance_to_segment(line, point):
+            """Return the squared distance from point to a line segment."""
+            (x1, y1), (x2, y2) = line
+            x, y = point
+            dx, dy = x2 - x1, y2 - y1
+            length = dx * dx + dy * dy
+            t = 0
+            if length > 0:
+                t = ((x - x1) * dx + (y - y1) * dy) / length
+                t = 0 if t < 0 else 1 if t > 1 else t
+            px, py = x1 + t * dx - x, y1 + t * dy - y
+            return px * px + py * py
 
         @classmethod
         def ellipse_point(cls, ellipse, point):
@@ -48,19 +79,90 @@ class Collider:
                     return True
             return False
 
+        @staticmethod
+        def __distance_to_axis_ellipse(e0, e1, y0, y1):
+            """Distance from (y0, y1), outside the ellipse, to its border.
+
+            The ellipse is axis aligned with semi-axes e0 >= e1, and the
+            point is in the first quadrant (D. Eberly, "Distance from a
+            Point to an Ellipse").
+            """
+            if y1 > 0:
+                if y0 > 0:
+                    z0, z1 = y0 / e0, y1 / e1
+                    r0 = (e0 * e0) / (e1 * e1)
+                    n0 = r0 * z0
+                    s0, s1 = z1 - 1, sqrt(n0 * n0 + z1 * z1) - 1
+                    for _ in range(Collider.ROOT_ITERATIONS):
+                        s = (s0 + s1) / 2
+                        if s == s0 or s == s1:
+                            break
+                        ratio0, ratio1 = n0 / (s + r0), z1 / (s + 1)
+                        g = ratio0 * ratio0 + ratio1 * ratio1 - 1
+                        if g > 0:
+                            s0 = s
+                        elif g < 0:
+                            s1 = s
+                        else:
+                            break
+                    x0, x1 = r0 * y0 / (s + r0), y1 / (s + 1)
+                    return sqrt((x0 - y0) * (x0 - y0) + (x1 - y1) * (x1 - y1))
+                return abs(y1 - e1)
+            numer0, denom0 = e0 * y0, e0 * e0 - e1 * e1
+            if numer0 < denom0:
+                xde0 = numer0 / denom0
+                x0, x1 = e0 * xde0, e1 * sqrt(1 - xde0 * xde0)
+                return sqrt((x0 - y0) * (x0 - y0) + x1 * x1)
+            return abs(y0 - e0)
+
         @classmethod
         def ellipse_ellipse(cls, e1, e2):
             """Verify collision between two ellipses."""
-            # TODO: implement it!
-            return False
+            h1, k1, rx1, ry1, sin1, cos1 = cls.__ellipse_axes(e1)
+            h2, k2, rx2, ry2, sin2, cos2 = cls.__ellipse_axes(e2)
+            # the enclosing circles do not touch.
+            dh, dk, reach = h1 - h2, k1 - k2, ry1 + ry2
+            if dh * dh + dk * dk > reach * reach:
+                return False
+            # map e2 to the frame where e1 is the unit circle, where it is
+            # the ellipse (cx, cy) + A * (cos t, sin t).
+            cx, cy = cls.__to_ellipse_frame(e1, (h2, k2))
+            a = (rx2 * cos2 * cos1 + rx2 * sin2 * sin1) / rx1
+            c = (rx2 * cos2 * sin1 - rx2 * sin2 * cos1) / ry1
+            b = (ry2 * sin2 * cos1 - ry2 * cos2 * sin1) / rx1
+            d = (ry2 * sin2 * sin1 + ry2 * cos2 * cos1) / ry1
+            # principal axes of the mapped ellipse, from A * A^T.
+            p, q, r = a * a + b * b, a * c + b * d, c * c + d * d
+            half = (p + r) / 2
+            disc = sqrt((p - r) * (p - r) / 4 + q * q)
+            l0, l1 = half + disc, max(half - disc, 0)
+            ux, uy = (l0 - r, q) if p >= r else (q, l0 - p)
+            norm = sqrt(ux * ux + uy * uy)
+            ux, uy = (ux / norm, uy / norm) if norm > 0 else (1, 0)
+            # the origin (e1 center) in the mapped ellipse frame.
+            z0 = abs(ux * cx + uy * cy)
+            z1 = abs(uy * cx - ux * cy)
+            e0, e1 = sqrt(l0), sqrt(l1)
+            if e1 == 0:
+                dx = max(z0 - e0, 0)
+                return dx * dx + z1 * z1 <= 1
+            if z0 * z0 / l0 + z1 * z1 / l1 <= 1:
+                return True
+            return cls.__distance_to_axis_ellipse(e0, e1, z0, z1) <= 1
 
         @classmethod
         def ellipse_line(cls, ellipse, line):
-            """Verify colision between an ellipse and a rectangle."""
-            for p in line:
-                if cls.ellipse_point(ellipse, p):
-                    return True
-            return False
+            """Verify collision between an ellipse and a line segment."""
+            p1, p2 = line
+            segment = (cls.__to_ellipse_frame(ellipse, p1),
+                       cls.__to_ellipse_frame(ellipse, p2))
+            return cls.__distance_to_segment(segment, (0, 0)) <= 0.95
+
+        @classmethod
+        def line_circle(cls, line, circle):
+            """Verify collision between a line segment and a circle."""
+            cx, cy, r = circle
+            return cls.__distance_to_segment(line, (cx, cy)) <= r * r
 
         @classmethod
         def circle_rect(cls, circle, rect):
@@ -106,45 +208,139 @@ class Collider:
         @classmethod
         def line_line(cls, l1, l2):
             """Check if a line segment intersects another."""
-            def abc(p1, p2):
-                x1, y1 = p1
-                x2, y2 = p2
-                a = y2 - y1
-                b = x1 - x2
-                c = x2 * y1 - x1 * y2
-                return (a, b, c)
-
-            def verify(abc, p1, p2):
-                a, b, c = abc
-                x1, y1 = p1
-                x2, y2 = p2
-                r1 = a * x2 + b * y1 + c
-                r2 = a * x1 + b * y2 + c
-                return r1 != 0 and r2 != 0 and sign(r1) == sign(r2)
+            def orientation(p, q, r):
+                cross = (q[0] - p[0]) * (r[1] - p[1])
+                return cross - (q[1] - p[1]) * (r[0] - p[0])
+
+            def overlap(a, b, c, d):
+                return min(a, b) <= max(c, d) and min(c, d) <= max(a, b)
 
             p1, p2 = l1
             p3, p4 = l2
-
-            if verify(abc(p1, p2), p3, p4):
-                return False
-            if verify(abc(p3, p4), p1, p2):
-                return False
-            return True
+            d1 = orientation(p3, p4, p1)
+            d2 = orientation(p3, p4, p2)
+            d3 = orientation(p1, p2, p3)
+            d4 = orientation(p1, p2, p4)
+            if d1 == d2 == d3 == d4 == 0:
+                # collinear segments, intersect if their projections do.
+                horizontal = overlap(p1[0], p2[0], p3[0], p4[0])
+                return horizontal and overlap(p1[1], p2[1], p3[1], p4[1])
+            return d1 * d2 <= 0 and d3 * d4 <= 0
 
         @classmethod
         def line_rect(cls, line, rect):
             """Check if a line segment intersects a rectangle."""
-            p1, p2 = line
+            (x1, y1), (x2, y2) = line
             x, y, w, h = rect
-            if cls.point_rect(p1, rect) or cls.point_rect(p2, rect):
-                return True
-            for l in (((x, y), (x + w, y)), ((x, y), (x, y + h)),
-                      ((x, y + h), (x + w, y + h)),
-                      ((x + w, y), (x + w, y + h))):
-                if cls.line_line(line, l):
+            dx, dy = x2 - x1, y2 - y1
+            # clip the segment parameter t in [0, 1] against each side.
+            t0, t1 = 0, 1
+            for p, q in ((-dx, x1 - x), (dx, x + w - x1),
+                         (-dy, y1 - y), (dy, y + h - y1)):
+                if p == 0:
+                    if q < 0:
+                        return False
+                else:
+                    t = q / p
+                    if p < 0:
+                        t0 = max(t0, t)
+                    else:
+                        t1 = min(t1, t)
+                    if t0 > t1:
+                        return False
+            return True
+
+        @staticmethod
+        @lru_cache(maxsize=256)
+        def __shape_mask(rx, ry, sina, cosa, limit):
+            """Build the mask of an ellipse centered at (ry, ry)."""
+            size = int(ry) + 1
+            grid = np.arange(-size, size + 1)
+            xh, yk = np.meshgrid(grid, grid, indexing='ij')
+            t1 = (xh * cosa - yk * sina) / rx
+            t2 = (xh * sina + yk * cosa) / ry
+            mask = pygame.mask.Mask((2 * size + 1, 2 * size + 1))
+            for p in zip(*np.nonzero(t1 * t1 + t2 * t2 <= limit)):
+                mask.set_at(p)
+            return mask, size
+
+        @staticmethod
+        @lru_cache(maxsize=256)
+        def __filled_mask(w, h):
+            mask = pygame.mask.Mask((w, h))
+            mask.fill()
+            return mask
+
+        @staticmethod
+        def __mask_box(m):
+            return m[:4]
+
+        @classmethod
+        def mask_mask(cls, m1, m2):
+            """Verify pixel collision between two masks."""
+            x1, y1, _, _, mask1 = m1
+            x2, y2, _, _, mask2 = m2
+            if not cls.rect_rect(cls.__mask_box(m1), cls.__mask_box(m2)):
+                return False
+            offset = (round(x2 - x1), round(y2 - y1))
+            return mask1.overlap(mask2, offset) is not None
+
+        @classmethod
+        def mask_rect(cls, m, rect):
+            """Verify pixel collision between a mask and a rectangle."""
+            x, y, _, _, mask = m
+            rx, ry, w, h = rect
+            if not cls.rect_rect(cls.__mask_box(m), rect):
+                return False
+            other = cls.__filled_mask(max(int(w), 1), max(int(h), 1))
+            return mask.overlap(other, (round(rx - x), round(ry - y))) \
+                is not None
+
+        @classmethod
+        def mask_point(cls, m, point):
+            """Verify if a point is over a pixel of the mask."""
+            x, y, w, h, mask = m
+            px, py = floor(point[0] - x), floor(point[1] - y)
+            return 0 <= px < w and 0 <= py < h and mask.get_at((px, py)) != 0
+
+        @classmethod
+        def mask_line(cls, m, line):
+            """Verify pixel collision between a mask and a line segment."""
+            if not cls.line_rect(line, cls.__mask_box(m)):
+                return False
+            (x1, y1), (x2, y2) = line
+            dx, dy = x2 - x1, y2 - y1
+            steps = int(max(abs(dx), abs(dy))) + 1
+            for i in range(steps + 1):
+                t = i / steps
+                if cls.mask_point(m, (x1 + t * dx, y1 + t * dy)):
                     return True
             return False
 
+        @classmethod
+        def mask_ellipse(cls, m, ellipse):
+            """Verify pixel collision between a mask and an ellipse."""
+            x, y, _, _, mask = m
+            h, k, rx, ry, sina, cosa = cls.__ellipse_axes(ellipse)
+            if not cls.rect_rect(cls.__mask_box(m),
+                                 (h - ry, k - ry, 2 * ry, 2 * ry)):
+                return False
+            other, r = cls.__shape_mask(rx, ry, sina, cosa, 0.95)
+            offset = (round(h - r - x), round(k - r - y))
+            return mask.overlap(other, offset) is not None
+
+        @classmethod
+        def mask_circle(cls, m, circle):
+            """Verify pixel collision between a mask and a circle."""
+            x, y, _, _, mask = m
+            cx, cy, r = circle
+            if not cls.rect_rect(cls.__mask_box(m),
+                                 (cx - r, cy - r, 2 * r, 2 * r)):
+                return False
+            other, size = cls.__shape_mask(r, r, 0, 1, 1)
+            offset = (round(cx - size - x), round(cy - size - y))
+            return mask.overlap(other, offset) is not None
+
         @classmethod
         def invert(cls, fn):
             def do_it(a, b):
@@ -157,6 +353,15 @@ class Collider:
     CIRCLE = "circle"
     LINE = "line"
     POINT = "point"
+    MASK = "mask"
+
+    # Bisection steps when finding the distance between ellipses.
+    ROOT_ITERATIONS = 64
+
+    # Collision layers are bit sets, objects only interact if the category
+    # of each one is in the mask of the other.
+    DEFAULT_LAYER = 1
+    ALL_LAYERS = -1
 
     __functions = {
         "ellipse_rect": __Algo.ellipse_rect,
@@ -169,8 +374,8 @@ class Collider:
         "circle_circle": __Algo.circle_circle,
         "ellipse_ellipse": __Algo.ellipse_ellipse,
         "line_line": __Algo.line_line,
-        "line_circle": lambda a, b: False,
-        "circle_line": __Algo.invert(lambda a, b: False),
+        "line_circle": __Algo.line_circle,
+        "circle_line": __Algo.invert(__Algo.line_circle),
         "line_rect": __Algo.line_rect,
         "rect_line": __Algo.invert(__Algo.line_rect),
         "line_ellipse": __Algo.invert(__Algo.ellipse_line),
@@ -179,39 +384,150 @@ class Collider:
         "ellipse_point": __Algo.ellipse_point,
         "point_rect": __Algo.point_rect,
         "rect_point": __Algo.invert(__Algo.point_rect),
+        "mask_mask": __Algo.mask_mask,
+        "mask_rect": __Algo.mask_rect,
+        "rect_mask": __Algo.invert(__Algo.mask_rect),
+        "mask_point": __Algo.mask_point,
+        "point_mask": __Algo.invert(__Algo.mask_point),
+        "mask_line": __Algo.mask_line,
+        "line_mask": __Algo.invert(__Algo.mask_line),
+        "mask_ellipse": __Algo.mask_ellipse,
+        "ellipse_mask": __Algo.invert(__Algo.mask_ellipse),
+        "mask_circle": __Algo.mask_circle,
+        "circle_mask": __Algo.invert(__Algo.mask_circle),
+    }
+
+    @staticmethod
+    def __ellipse_box(ellipse):
+        # the ellipse may be rotated, use the enclosing circle.
+        cx, cy, w, h, *_ = ellipse
+        r = max(w, h) / 2
+        return (cx - r, cy - r, 2 * r, 2 * r)
+
+    @staticmethod
+    def __line_box(line):
+        (x1, y1), (x2, y2) = line
+        x, y = min(x1, x2), min(y1, y2)
+        return (x, y, max(x1, x2) - x, max(y1, y2) - y)
+
+    __boxes = {
+        ELLIPSE: __ellipse_box.__func__,
+        RECT: lambda rect: rect,
+        CIRCLE: lambda c: (c[0] - c[2], c[1] - c[2], 2 * c[2], 2 * c[2]),
+        LINE: __line_box.__func__,
+        POINT: lambda p: (p[0], p[1], 0, 0),
+        MASK: lambda m: m[:4],
     }
 
+    @staticmethod
+    def __dispatch_table(functions, shapes):
+        def never(a, b):
+            return False
+        return [[functions.get(a + "_" + b, never) for b in shapes]
+                for a in shapes]
+
+    # Shapes are resolved to an integer id on construction, and indexes
+    # the dispatch table of collision functions.
+    __shapes = [ELLIPSE, RECT, CIRCLE, LINE, POINT, MASK]
+    __dispatch = __dispatch_table.__func__(__functions, __shapes)
+
+    @staticmethod
+    def rotation_terms(angle):
+        """Return the sine and cosine used to rotate points to an ellipse."""
+        rad = -1 * angle * pi / 180
+        return (sin(rad), cos(rad))
+
     def __init__(self, bounding_shape):
         """Initialize the collision detection algorithms."""
         self.__bounding_shape = bounding_shape
+        self.__shape_id = Collider.__shapes.index(bounding_shape) \
+            if bounding_shape in Collider.__shapes else None
+        self.__cached_bounds = None
+        self.__cached_aabb = None
+        self.__rotation = (None, None)
         self.should_collide = True
+        self.collision_category = Collider.DEFAULT_LAYER
+        self.collision_mask = Collider.ALL_LAYERS
 
     @property
     def bounding_shape(self):
         """Retrieve the object bounding shape."""
         return self.__bounding_shape
 
+    def set_layers(self, category, mask=ALL_LAYERS):
+        """Set the collision layer of the object, and the ones it sees."""
+        self.collision_category = category
+        self.collision_mask = mask
+
+    def interacts_with(self, object):
+        """Return true if the collision layers of the objects match."""
+        sees = self.collision_category & object.collision_mask
+        return bool(sees and object.collision_category & self.collision_mask)
+
     def did_collide(self, object):
         """Return true if collides with object."""
         if not self.should_collide or not object.should_collide:
             return False
-        shape = self.bounding_shape + "_" + object.bounding_shape
-        fn = Collider.__functions.get(shape, lambda a, b: False)
-        return fn(self.bounds, object.bounds)
+        a, b = self.__shape_id, object.__shape_id
+        if a is None or b is None:
+            return False
+        fn = Collider.__dispatch[a][b]
+        return fn(self.collision_bounds, object.collision_bounds)
 
     def collide_with(self, object):
         """Handle collision event."""
         raise NotImplementedError("Subclasses must implement collide_with().")
 
+    def moved(self):
+        """Invalidate cached bounds when the object moves."""
+        self.__cached_bounds = None
+        self.__cached_aabb = None
+
     @property
     def bounds(self):
         """Query object bounds."""
-        x, y = self.position
+        shape = self.bounding_shape
+        if shape == Collider.RECT:
+            x, y = self.position
+            w, h = self.dimension
+            return (x, y, w, h)
+        if shape == Collider.MASK:
+            x, y = self.position
+            mask = self.mask
+            return (x, y, *mask.get_size(), mask)
         cx, cy = self.center
         w, h = self.dimension
-        a = self.rotation
-        case = {Collider.ELLIPSE: (cx, cy, w, h, a),
-                Collider.RECT: (x, y, w, h),
-                Collider.CIRCLE: (cx, cy, min(w, h) // 2),
-                }
-        return case[self.bounding_shape]
+        if shape == Collider.ELLIPSE:
+            return (cx, cy, w, h, self.rotation)
+        if shape == Collider.CIRCLE:
+            return (cx, cy, min(w, h) // 2)
+        raise KeyError(shape)
+
+    @property
+    def collision_bounds(self):
+        """Query object bounds, cached until the object moves.
+
+        Ellipse bounds are extended with the rotation sine and cosine. Masks
+        are not cached, as they change with the animation frame.
+        """
+        if self.bounding_shape == Collider.MASK:
+            return self.bounds
+        if self.__cached_bounds is None:
+            bounds = self.bounds
+            if self.bounding_shape == Collider.ELLIPSE:
+                angle, terms = self.__rotation
+                if angle != bounds[4]:
+                    angle = bounds[4]
+                    terms = Collider.rotation_terms(angle)
+                    self.__rotation = (angle, terms)
+                bounds = bounds + terms
+            self.__cached_bounds = bounds
+        return self.__cached_bounds
+
+    @property
+    def aabb(self):
+        """Query the axis aligned box (x, y, w, h) enclosing the object."""
+        if self.__cached_aabb is None:
+            box = Collider.__boxes[self.bounding_shape]
+            self.__cached_aabb = box(self.collision_bounds)
+        return self.__cached_aabb
@@ -2,6 +2,7 @@
 
 from math import pi, sin, exp
 from .util import Command
+from .gameobject import GameObject
 
 
 # def KeyboardController(game, directional, special: dict):
@@ -50,6 +51,11 @@ class KeyboardController:
         return self.__move
 
 
+# Controllers return the movement of an object in a nominal simulation step,
+# the object scales it by GameObject.step_scale(). Controllers following a
+# curve advance along it by the same scale.
+
+
 def ConstantController(dx, dy, speed=1):
     """Define a controller that moves the object in a straight line."""
     while True:
@@ -85,7 +91,7 @@ def SinController(length, freq, amp, speed=1, vertical=False):
         next = amp * sin(factor * i)
         value = next
         yield (speed, value) if not vertical else (value, speed)
-        i += speed
+        i += speed * GameObject.step_scale()
 
 
 def __sigmoid(x, temperature, length):
@@ -99,11 +105,12 @@ def SigmoidController(length, amp, temperature=1, speed=1, vertical=False):
     x = 0
     last = 0
     while True:
+        scale = GameObject.step_scale()
         next = amp * (2 * __sigmoid(x, temperature, length) - 1)
-        value = (next - last)
+        value = (next - last) / scale
         yield (speed, value) if not vertical else (value, speed)
         last = next
-        x += speed
+        x += speed * scale
 
 
 def SigmoidPrimeController(length, amp, temp=1, speed=1, vertical=False):
@@ -111,12 +118,13 @@ def SigmoidPrimeController(length, amp, temp=1, speed=1, vertical=False):
     x = 0
     last = 0
     while True:
+        scale = GameObject.step_scale()
         sigp = __sigmoid(x, temp, length)
         next = amp * 4 * (sigp * (1 - sigp))
-        value = (next - last)
+        value = (next - last) / scale
         yield (speed, value) if not vertical else (value, speed)
         last = next
-        x += speed
+        x += speed * scale
 
 
 def InvertedSigmoidController(length, amp, temp=1, speed=1, vertical=False):
@@ -124,8 +132,9 @@ def InvertedSigmoidController(length, amp, temp=1, speed=1, vertical=False):
     x = 0
     last = 0
     while True:
+        scale = GameObject.step_scale()
         next = amp * (1 - (2 * __sigmoid(x, temp, length) - 1))
-        value = (next - last)
+        value = (next - last) / scale
         yield (speed, value) if not vertical else (value, speed)
         last = next
-        x += speed
+        x += speed * scale
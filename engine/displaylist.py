@@ -0,0 +1,75 @@
+"""Scene objects kept in priority order."""
+
+from bisect import insort
+
+
+class DisplayList:
+    """Scene objects, as (name, object), bucketed by priority.
+
+    Objects are updated from the lowest to the highest priority value, and
+    drawn in the reverse order, so objects with lower values are drawn on
+    top. Objects with the same priority keep the order they were added.
+
+    Adding an object appends it to the bucket of its priority. Removed
+    objects leave an empty slot in their bucket, and the bucket is
+    compacted once half of it is empty.
+    """
+
+    def __init__(self):
+        """Initialize an empty display list."""
+        self.__buckets = {}
+        self.__priorities = []
+        self.__empty = {}
+        self.__count = 0
+
+    def add(self, name, obj):
+        """Add an object to the list."""
+        priority = obj.priority
+        bucket = self.__buckets.get(priority)
+        if bucket is None:
+            bucket = self.__buckets[priority] = []
+            self.__empty[priority] = 0
+            insort(self.__priorities, priority)
+        bucket.append((name, obj))
+        self.__count += 1
+
+    def remove_if(self, predicate):
+        """Remove objects for which predicate(name, object) is true.
+
+        Return the list of removed (name, object).
+        """
+        removed = []
+        for priority in self.__priorities:
+            bucket = self.__buckets[priority]
+            count = len(removed)
+            for i, entry in enumerate(bucket):
+                if entry is not None and predicate(*entry):
+                    bucket[i] = None
+                    removed.append(entry)
+            empty = self.__empty[priority] + len(removed) - count
+            if 2 * empty > len(bucket):
+                bucket[:] = [e for e in bucket if e is not None]
+                empty = 0
+            self.__empty[priority] = empty
+        self.__count -= len(removed)
+        return removed
+
+    def __iter__(self):
+        """Iterate objects from the lowest to the highest priority."""
+        for priority in self.__priorities:
+            for entry in self.__buckets[priority]:
+                if entry is not None:
+                    yield entry
+
+    def __reversed__(self):
+        """Iterate objects from the highest to the lowest priority."""
+        for priority in reversed(self.__priorities):
+            bucket = self.__buckets[priority]
+            for i in range(len(bucket) - 1, -1, -1):
+                entry = bucket[i]
+                if entry is not None:
+                    yield entry
+
+    def __len__(self):
+        """Return the number of objects."""
+        return self.__count
@@ -5,11 +5,16 @@ from .util import get_value, list_reverse
 from .window import Window
 from .util import ValueReference, TheGame, GameVariable
 from .text import Font
+from .profiler import Profiler, ProfilerOverlay
+from .preload import Preloader
+from .behaviors import Movable
+from .gameobject import GameObject
 
 import pygame
 
 from collections import defaultdict
 from functools import partial
+import os
 
 
 class GameFont(ValueReference):
@@ -50,7 +55,25 @@ class Game:
                     size = mode
                     break
         fullscreen = config.get("fullscreen", False)
-        return Window(size=size, fullscreen=fullscreen)
+        dirty_rects = config.get("dirty_rects", False)
+        return Window(size=size, fullscreen=fullscreen,
+                      dirty_rects=dirty_rects)
+
+    def __init_overlay(self, config):
+        if not config or self.__headless:
+            return None
+        config = dict(config)
+        font = self.get_font(config.pop('font'))
+        return ProfilerOverlay(self.__profiler, font, **config)
+
+    @staticmethod
+    def __init_headless():
+        """Use SDL dummy drivers, restarting any initialized subsystem."""
+        os.environ['SDL_VIDEODRIVER'] = 'dummy'
+        os.environ['SDL_AUDIODRIVER'] = 'dummy'
+        pygame.display.quit()
+        pygame.mixer.quit()
+        pygame.display.init()
 
     def __init__(self, script, **kwargs):
         """
@@ -58,11 +81,39 @@ class Game:
 
         Optional name parameters:
             - fps: the maximum number of fames per second. (Default: 60)
+            - tick_rate: the number of simulation steps per second. Object
+                         movement is scaled by the step duration, so the
+                         game speed does not change. (Default: fps)
+            - max_steps: maximum simulation steps run to catch up with
+                         real time between two frames. (Default: 5)
+            - interpolate: draw movable objects between their last two
+                           simulated positions. (Default: False)
+            - preload_workers: number of threads loading the assets of
+                               the next scenes. (Default: 2)
+            - profile.frames: number of recent frames kept by the
+                              profiler. (Default: 120)
+            - profile.overlay: show frame statistics on screen, with
+                               the keys 'font' (a game font name),
+                               'position', 'color' and 'refresh'.
+                               (Default: None)
+
+        Optional keyword arguments:
+            - headless: run without a visible window or sound, and without
+                        waiting for the frame rate. (Default: False)
         """
         self.running = False
+        self.__headless = kwargs.get('headless', False)
+        if self.__headless:
+            Game.__init_headless()
         self.__clock = pygame.time.Clock()
         self.__fps = get_value(script, 'fps', 60)
+        self.__tick_rate = get_value(script, 'tick_rate', self.__fps)
+        self.__step = 1000 / self.__tick_rate
+        self.__frame = 0
+        self.__max_steps = get_value(script, 'max_steps', 5)
+        self.__interpolate = get_value(script, 'interpolate', False)
         self.__scenes = {}
+        self.__preloader = Preloader(get_value(script, 'preload_workers', 2))
         self.__events = {
             pygame.QUIT: self.stop,
             pygame.KEYDOWN: self.__keydown,
@@ -77,6 +128,9 @@ class Game:
         self.__game_over = True
         self.__fonts = self.__load_fonts(script.get("fonts", {}))
         self.__window = self.__init_window(script['window'])
+        self.__profiler = Profiler(get_value(script, 'profile.frames', 120))
+        self.__overlay = self.__init_overlay(get_value(script,
+                                                       'profile.overlay'))
         self.__variables = {name: GameVariable(name, desc, self) for name, desc
                             in script.get("variables", {}).items()}
         TheGame.game = self
@@ -129,41 +183,126 @@ class Game:
         if script is None:
             self.running = False
             return None
+        # make sure the scene assets are loaded.
+        self.__preloader.preload(script)
+        self.__preloader.wait(script['name'])
         scene = Scene(self, script)
         for (key, handler) in scene.key_events:
             fn = partial(getattr(scene, handler), self)
             self.on_key_up(key, fn)
         self.__current_scene = scene
-
-    def run(self, first_scene):
-        """Start the game loop."""
+        # load the assets of the next scenes while this one runs.
+        for name in set(scene.next_scene.values()):
+            if name in self.__scenes:
+                self.__preloader.preload(self.__scenes[name])
+
+    def __handle_events(self):
+        for event in pygame.event.get():
+            self.__events.get(event.type, Game.__ignore_event)(event)
+        self.__profiler.lap('events')
+
+    def __simulate(self):
+        """Run a single simulation step of the current scene."""
+        scene = self.__current_scene
+        profiler = self.__profiler
+        # notify scene of new frame.
+        scene.frame(self.__frame, self.__step)
+        self.__frame += 1
+        profiler.lap('frame')
+        # verify collisions
+        scene.verify_collisions()
+        profiler.lap('collisions')
+        # update objects
+        scene.update_objects(self.__window.bounds)
+        profiler.lap('update')
+
+    def __end_frame(self):
+        scene = self.__current_scene
+        self.__profiler.end_frame(objects=scene.object_count,
+                                  pairs=scene.collision_pairs)
+
+    def __next_scene(self):
+        next = "game_over" if self.__game_over else "end_scene"
+        name = self.__current_scene.next_scene[next]
+        self.__start_scene(self.__scenes[name])
+        self.__window.invalidate()
+        self.__frame = 0
+
+    def start(self, first_scene):
+        """Start the game at the given scene, without running the loop."""
         self.running = True
-        frame = 0
+        self.__frame = 0
+        GameObject.step = self.__step
         self.__start_scene(self.__scenes[first_scene])
+
+    def step(self, count=1):
+        """
+        Run simulation steps as fast as possible, without drawing.
+
+        Returns the number of steps executed, which is less than count if
+        the game stops.
+        """
+        for n in range(count):
+            if not (self.running and self.__current_scene):
+                return n
+            self.__profiler.start()
+            self.__handle_events()
+            self.__simulate()
+            self.__end_frame()
+            if self.__current_scene.stop:
+                self.__next_scene()
+        return count
+
+    def run(self, first_scene):
+        """Start the game loop.
+
+        The scene is simulated in fixed steps of 1000 / tick_rate
+        miliseconds, as many as needed to keep up with the real time
+        measured between frames, and drawn once per frame. A headless
+        game is simulated as fast as possible.
+        """
+        self.start(first_scene)
+        if self.__headless:
+            while self.step():
+                pass
+            return
+        step = self.__step
+        profiler = self.__profiler
+        self.__clock.tick()
+        profiler.start()
+        elapsed = step
         while self.running and self.__current_scene:
-            # notify scene of new frame.
-            self.__current_scene.frame(frame, 1000 / self.__fps)
-            frame += 1
+            scene = self.__current_scene
             # handle events
-            for event in pygame.event.get():
-                self.__events.get(event.type, Game.__ignore_event)(event)
-            # verify collisions
-            self.__current_scene.verify_collisions()
-            # update objects
-            self.__current_scene.update_objects(self.__window.bounds)
+            self.__handle_events()
+            # simulate the elapsed time.
+            steps = 0
+            while elapsed >= step and not scene.stop:
+                if steps == self.__max_steps:
+                    # too far behind, let the game slow down.
+                    elapsed = step
+                    break
+                self.__simulate()
+                elapsed -= step
+                steps += 1
+            if self.__interpolate:
+                Movable.interpolation = elapsed / step
             # draw objects
             self.__window.clear()
-            self.__current_scene.draw(self.__window)
+            scene.draw(self.__window)
+            if self.__overlay is not None:
+                self.__window.draw(self.__overlay)
+            profiler.lap('draw')
             # swap buffers
-            pygame.display.update()
+            self.__window.update()
+            profiler.lap('display')
             # ensure loop do not run faster than FPS.
-            self.__clock.tick(self.__fps)
-            if self.__current_scene.stop:
-                next = "game_over" if self.__game_over else "end_scene"
-                scenes = self.__current_scene.next_scene
-                scene = scenes[next]
-                self.__start_scene(self.__scenes[scene])
-                frame = 0
+            elapsed += self.__clock.tick(self.__fps)
+            profiler.lap('wait')
+            self.__end_frame()
+            if scene.stop:
+                self.__next_scene()
+                elapsed = step
 
     def add_scene(self, scene):
         """Add a scene to the script."""
@@ -217,6 +356,16 @@ class Game:
         self.__game_over = True
         self.__current_scene.end_scene()
 
+    @property
+    def headless(self):
+        """Return true if the game runs without a visible window."""
+        return self.__headless
+
+    @property
+    def profiler(self):
+        """Retrieve the frame profiler."""
+        return self.__profiler
+
     @property
     def window(self):
         """Retrieve the game window"""
@@ -19,6 +19,12 @@ class GameObject(Bindable):
         DEFAULT = 500
         BACKGROUND = 1000
 
+    # Duration of a simulation step, in miliseconds, set by the game. Speeds
+    # are given in pixels per NOMINAL_STEP, and scaled by step_scale(), so
+    # the game speed does not depend on the tick rate.
+    NOMINAL_STEP = 1000 / 60
+    step = NOMINAL_STEP
+
     def __init__(self, priority):
         """Initialize the common Game Object data."""
         Bindable.__init__(self)
@@ -31,13 +37,22 @@ class GameObject(Bindable):
         raise NotImplementedError("Method update() is not implemented.")
 
     def draw(self, screen):
-        """Draw object on the screen."""
+        """Draw object on the screen.
+
+        Return the rectangle, or list of rectangles, changed on the screen,
+        or None if they are not known.
+        """
         raise NotImplementedError("Method draw() is not implemented.")
 
     def offlimits(self, limits):
         """Take action when object is off-limits, return if needs update."""
         raise NotImplementedError("Method offlimits() is not implemented.")
 
+    @staticmethod
+    def step_scale():
+        """Return the duration of a simulation step, in nominal steps."""
+        return GameObject.step / GameObject.NOMINAL_STEP
+
     @property
     def priority(self):
         """Return the object priority."""
@@ -51,3 +66,7 @@ class GameObject(Bindable):
     def destroy(self):
         """Mark the object for elimination."""
         self.__valid = False
+
+    def restore(self):
+        """Undo destroy(), when the object is reused."""
+        self.__valid = True
@@ -2,12 +2,156 @@
 
 from PIL import Image
 import pygame
+from collections import OrderedDict
 from .shadows import add_shadow
+from ..assets import convert
 from time import time
 
 
+class GIFFrames(object):
+    """Decoded frames of a GIF file, shared by every GIFImage using it.
+
+    By default every frame is decoded when the animation is loaded. In
+    streaming mode, only the frame durations are read up front, and frames
+    are decoded when needed, keeping at most `cache` decoded frames and
+    collision masks.
+    """
+
+    # decoded animations, by (filename, scale, time_scale, cache)
+    __store = {}
+    # cache key of collision masks, in place of a shadow.
+    __MASK = "mask"
+
+    @classmethod
+    def get(cls, filename, scale=1.0, time_scale=1.0, cache=None):
+        """Return the frames of a GIF file, decoding it only once."""
+        key = (filename, scale, time_scale, cache)
+        frames = cls.__store.get(key)
+        if frames is None:
+            frames = cls(filename, scale, time_scale, cache)
+            # frames are only shared once converted to the display format.
+            if pygame.display.get_surface() is not None:
+                cls.__store[key] = frames
+        return frames
+
+    @classmethod
+    def clear(cls):
+        """Release every stored animation."""
+        cls.__store.clear()
+
+    def __init__(self, filename, scale=1.0, time_scale=1.0, cache=None):
+        """
+        Load a GIF file.
+
+        If cache is not None, frames are streamed from the file, keeping
+        at most `cache` decoded frames in memory.
+        """
+        self.filename = filename
+        self.scale = scale
+        self.time_scale = time_scale
+        self.durations = []
+        self.__cache = cache
+        # decoded surfaces, by (index, shadow), and masks, by (index, MASK)
+        self.__surfaces = OrderedDict()
+        image = Image.open(filename)
+        self.size = image.size
+        pal = image.getpalette()
+        self.__palette = [[pal[j] for j in range(i, i + 3)]
+                          for i in range(0, len(pal), 3)]
+        try:
+            while 1:
+                duration = image.info.get("duration", 100)
+                # convert to seconds!
+                self.durations.append(duration * .001 * self.time_scale)
+                if cache is None:
+                    index = len(self.durations) - 1
+                    self.__surfaces[(index, None)] = self.__decode(image)
+                image.seek(image.tell() + 1)
+        except EOFError:
+            pass
+        if cache is None:
+            image.close()
+        else:
+            image.seek(0)
+            self.__image = image
+
+    def __decode(self, image):
+        """Decode the current frame of an image."""
+        x0, y0, x1, y1 = (0, 0) + image.size
+        tile = image.tile
+        if len(tile) > 0:
+            x0, y0, x1, y1 = tile[0][1]
+
+        sz = tuple(int(v * self.scale) for v in image.size)
+        pi = pygame.image.fromstring(image.tobytes(), image.size, image.mode)
+        pi = pygame.transform.scale(pi, sz)
+        # newer Pillow versions decode frames after the first
+        # to RGB(A), which are not indexed.
+        if pi.get_bitsize() == 8:
+            pi.set_palette(self.__palette)
+            if "transparency" in image.info:
+                pi.set_colorkey(image.info["transparency"])
+        pi2 = pygame.Surface(sz, pygame.SRCALPHA)
+        pi2.blit(pi, (x0, y0), (x0, y0, x1 - x0, y1 - y0))
+        return convert(pi2)
+
+    def __stream(self, index):
+        """Decode a frame from the file."""
+        image = self.__image
+        if index < image.tell():
+            image.seek(0)
+        while image.tell() < index:
+            image.seek(image.tell() + 1)
+        return self.__decode(image)
+
+    def __create(self, index, shadow):
+        if not shadow:
+            return self.__stream(index)
+        offset, scale, amb = shadow
+        surface = add_shadow(self.frame(index), offset,
+                             shadow_scale=scale, ambience=amb)
+        return convert(surface)
+
+    def __cached(self, key, create):
+        """Return a cached surface or mask, creating it if needed."""
+        surfaces = self.__surfaces
+        value = surfaces.get(key)
+        if value is None:
+            value = surfaces[key] = create()
+            if self.__cache is not None and len(surfaces) > self.__cache:
+                surfaces.popitem(last=False)
+        elif self.__cache is not None:
+            surfaces.move_to_end(key)
+        return value
+
+    def mask(self, index):
+        """Return the collision mask of a frame."""
+        def create():
+            return pygame.mask.from_surface(self.frame(index))
+        return self.__cached((index, GIFFrames.__MASK), create)
+
+    def frame(self, index, shadow=None):
+        """Return the surface of a frame, with a shadow if given.
+
+        The shadow is given as (offset, scale, ambience), and the frame
+        with the shadow is composed only once.
+        """
+        return self.__cached((index, shadow or None),
+                             lambda: self.__create(index, shadow))
+
+    def __len__(self):
+        """Get number of frames."""
+        return len(self.durations)
+
+
 class GIFImage(object):
-    """Define a sprite with its animation."""
+    """Define a sprite with its animation.
+
+    Decoded frames are shared through GIFFrames, so each instance only
+    keeps its playback state. Large animations can be streamed from the
+    file by giving the maximum number of decoded frames to keep in
+    `cache_frames`.
+    """
 
     def __init__(self, filename, pos=(0, 0), **kwargs):
         """Initialize a new sprite object."""
@@ -16,79 +160,25 @@ class GIFImage(object):
         self.time_scale = kwargs.get('time_scale', 1.0)
         self.scale = kwargs.get('scale', 1.0)
         self.filename = filename
-        self.image = Image.open(filename)
-        self.frames = []
-        self.__get_frames()
+        cache = kwargs.get('cache_frames', None)
+        self.__frames = GIFFrames.get(filename, self.scale, self.time_scale,
+                                      cache)
         self.cur = 0
         self.ptime = time()
         self.running = True
-        self.breakpoint = len(self.frames) - 1
+        self.breakpoint = len(self.__frames) - 1
         self.startpoint = 0
         self.reversed = False
         self.pos = pos
 
     def get_rect(self):
         """Return sprite 'bounds' (x, y, w, h)."""
-        return pygame.rect.Rect(self.pos, self.image.size)
-
-    def __get_frames(self):
-        image = self.image
-
-        pal = image.getpalette()
-        palette = [[pal[j] for j in range(i, i + 3)]
-                   for i in range(0, len(pal), 3)]
-
-        all_tiles = []
-        try:
-            while 1:
-                if not image.tile:
-                    image.seek(0)
-                else:
-                    all_tiles.append(image.tile[0][3][0])
-                image.seek(image.tell() + 1)
-        except EOFError:
-            image.seek(0)
-
-        all_tiles = tuple(set(all_tiles))
-
-        try:
-            while 1:
-                duration = image.info.get("duration", 100)
-
-                duration *= .001 * self.time_scale  # convert to milliseconds!
-                cons = False
-
-                x0, y0, x1, y1 = (0, 0) + image.size
-                if image.tile:
-                    tile = image.tile
-                else:
-                    image.seek(0)
-                    tile = image.tile
-                if len(tile) > 0:
-                    x0, y0, x1, y1 = tile[0][1]
-
-                sz = tuple(int(v * self.scale) for v in image.size)
-                pi = pygame.image.fromstring(image.tobytes(),
-                                             image.size, image.mode)
-                pi = pygame.transform.scale(pi, sz)
-                pi.set_palette(palette)
-                if "transparency" in image.info:
-                    pi.set_colorkey(image.info["transparency"])
-                pi2 = pygame.Surface(sz, pygame.SRCALPHA)
-                if cons:
-                    for i in self.frames:
-                        pi2.blit(i[0], (0, 0))
-                pi2.blit(pi, (x0, y0), (x0, y0, x1 - x0, y1 - y0))
-
-                self.frames.append([pi2, duration])
-                image.seek(image.tell() + 1)
-        except EOFError:
-            pass
+        return pygame.rect.Rect(self.pos, self.__frames.size)
 
     def draw(self, screen, pos=None, loop=True):
         """Draw the sprite to the given screen."""
         if self.running:
-            if time() - self.ptime > self.frames[self.cur][1]:
+            if time() - self.ptime > self.__frames.durations[self.cur]:
                 if self.reversed:
                     self.cur -= 1
                     if self.cur < self.startpoint:
@@ -100,24 +190,26 @@ class GIFImage(object):
                         if not (self.loop and loop):
                             self.cur = self.breakpoint
                             self.running = False
-                            return
+                            return []
 
                 self.ptime = time()
-        blt = self.frames[self.cur][0]
-        if self.__shadow:
-            offset, scale, amb = self.__shadow
-            blt = add_shadow(blt, offset, shadow_scale=scale, ambience=amb)
-        screen.blit(blt, pos)
+        blt = self.__frames.frame(self.cur, self.__shadow)
+        return screen.blit(blt, pos)
+
+    @property
+    def mask(self):
+        """Return the collision mask of the current frame."""
+        return self.__frames.mask(self.cur)
 
     def seek(self, frame):
         """Set next frame to the given one."""
-        assert frame >= 0 and frame <= len(self.frames)
+        assert frame >= 0 and frame <= len(self.__frames)
         self.cur = frame
 
     def set_frames(self, start, end):
         """Set frame range to use."""
-        assert start >= 0 and start < len(self.frames) - 1
-        assert end >= 0 and end < len(self.frames) - 1
+        assert start >= 0 and start < len(self.__frames) - 1
+        assert end >= 0 and end < len(self.__frames) - 1
         if end < start:
             start, end = end, start
             self.reversed = True
@@ -143,23 +235,23 @@ class GIFImage(object):
 
     def get_height(self):
         """Get image height."""
-        return self.image.size[1]
+        return self.__frames.size[1]
 
     def get_width(self):
         """Get image width."""
-        return self.image.size[0]
+        return self.__frames.size[0]
 
     def get_size(self):
         """Get image size."""
-        return self.image.size
+        return self.__frames.size
 
     def length(self):
         """Get number of frames."""
-        return len(self.frames)
+        return len(self.__frames)
 
     def duration(self):
         """Get the duration in ms of the animation."""
-        return sum(f[1] * 1000 for f in self.frames)
+        return sum(self.__frames.durations) * 1000
 
     def reverse(self):
         """Play reversed."""
@@ -168,5 +260,5 @@ class GIFImage(object):
     def reset(self):
         """Reset animations."""
         self.cur = 0
-        self.ptime = time.time()
+        self.ptime = time()
         self.reversed = False
@@ -0,0 +1,276 @@
+"""Vectorized narrow phase, testing many pairs of shapes at once.
+
+Each kernel receives arrays with the bounds of the first and second shapes
+of every pair, in the same layout as Collider.collision_bounds, and returns
+a boolean array with the result of the test for each pair. Results are the
+same as the scalar algorithms in Collider.
+"""
+
+import numpy as np
+
+from math import pi
+
+from .collider import Collider
+
+
+# Bisection steps when finding the distance between ellipses.
+ROOT_ITERATIONS = Collider.ROOT_ITERATIONS
+
+
+def __ellipse_axes(ellipse):
+    h, k, w, hh, a, *rotation = ellipse.T
+    rx = np.where(w <= hh, w // 2, hh // 2)
+    ry = np.where(w <= hh, hh // 2, w // 2)
+    if rotation:
+        sina, cosa = rotation
+    else:
+        rad = -1 * a * pi / 180
+        sina = np.sin(rad)
+        cosa = np.cos(rad)
+    return (h, k, rx, ry, sina, cosa)
+
+
+def __to_ellipse_frame(ellipse, x, y):
+    h, k, rx, ry, sina, cosa = __ellipse_axes(ellipse)
+    xh = x - h
+    yk = y - k
+    t1 = xh * cosa - yk * sina
+    t2 = xh * sina + yk * cosa
+    return (t1 / rx, t2 / ry)
+
+
+def __distance_to_ellipse(ellipse, x, y):
+    t1, t2 = __to_ellipse_frame(ellipse, x, y)
+    return t1 * t1 + t2 * t2
+
+
+def __distance_to_segment(x1, y1, x2, y2, x, y):
+    dx, dy = x2 - x1, y2 - y1
+    length = dx * dx + dy * dy
+    nonzero = length > 0
+    t = ((x - x1) * dx + (y - y1) * dy) / np.where(nonzero, length, 1)
+    t = np.where(nonzero, np.clip(t, 0, 1), 0)
+    px, py = x1 + t * dx - x, y1 + t * dy - y
+    return px * px + py * py
+
+
+def __corners(rect):
+    x, y, w, h = rect.T
+    return ((x, y), (x, y + h), (x + w, y), (x + w, y + h))
+
+
+def ellipse_point(ellipse, point):
+    """Verify collision between ellipses and points."""
+    x, y = point.T
+    return __distance_to_ellipse(ellipse, x, y) <= 0.95
+
+
+def ellipse_circle(ellipse, circle):
+    """Verify collision between ellipses and circles."""
+    x, y, r = circle.T
+    return __distance_to_ellipse(ellipse, x, y) <= (1 + r)
+
+
+def ellipse_rect(ellipse, rect):
+    """Verify collision between ellipses and rectangles."""
+    result = np.zeros(len(ellipse), dtype=bool)
+    for x, y in __corners(rect):
+        result |= __distance_to_ellipse(ellipse, x, y) <= 0.95
+    return result
+
+
+def __distance_to_axis_ellipse(e0, e1, y0, y1):
+    z0, z1 = y0 / e0, y1 / e1
+    r0 = (e0 * e0) / (e1 * e1)
+    n0 = r0 * z0
+    s0, s1 = z1 - 1, np.sqrt(n0 * n0 + z1 * z1) - 1
+    for _ in range(ROOT_ITERATIONS):
+        # once a root is found, s0 and s1 no longer change.
+        s = (s0 + s1) / 2
+        ratio0, ratio1 = n0 / (s + r0), z1 / (s + 1)
+        g = ratio0 * ratio0 + ratio1 * ratio1 - 1
+        s0 = np.where(g > 0, s, s0)
+        s1 = np.where(g < 0, s, s1)
+    x0, x1 = r0 * y0 / (s + r0), y1 / (s + 1)
+    both = np.sqrt((x0 - y0) * (x0 - y0) + (x1 - y1) * (x1 - y1))
+    numer0, denom0 = e0 * y0, e0 * e0 - e1 * e1
+    xde0 = numer0 / denom0
+    x0, x1 = e0 * xde0, e1 * np.sqrt(1 - xde0 * xde0)
+    on_axis = np.where(numer0 < denom0,
+                       np.sqrt((x0 - y0) * (x0 - y0) + x1 * x1),
+                       np.abs(y0 - e0))
+    return np.where(y1 > 0, np.where(y0 > 0, both, np.abs(y1 - e1)),
+                    on_axis)
+
+
+def ellipse_ellipse(e1, e2):
+    """Verify collision between ellipses."""
+    with np.errstate(all='ignore'):
+        h1, k1, rx1, ry1, sin1, cos1 = __ellipse_axes(e1)
+        h2, k2, rx2, ry2, sin2, cos2 = __ellipse_axes(e2)
+        dh, dk, reach = h1 - h2, k1 - k2, ry1 + ry2
+        near = dh * dh + dk * dk <= reach * reach
+        cx, cy = __to_ellipse_frame(e1, h2, k2)
+        a = (rx2 * cos2 * cos1 + rx2 * sin2 * sin1) / rx1
+        c = (rx2 * cos2 * sin1 - rx2 * sin2 * cos1) / ry1
+        b = (ry2 * sin2 * cos1 - ry2 * cos2 * sin1) / rx1
+        d = (ry2 * sin2 * sin1 + ry2 * cos2 * cos1) / ry1
+        p, q, r = a * a + b * b, a * c + b * d, c * c + d * d
+        half = (p + r) / 2
+        disc = np.sqrt((p - r) * (p - r) / 4 + q * q)
+        l0, l1 = half + disc, np.maximum(half - disc, 0)
+        ux = np.where(p >= r, l0 - r, q)
+        uy = np.where(p >= r, q, l0 - p)
+        norm = np.sqrt(ux * ux + uy * uy)
+        ux = np.where(norm > 0, ux / norm, 1)
+        uy = np.where(norm > 0, uy / norm, 0)
+        z0 = np.abs(ux * cx + uy * cy)
+        z1 = np.abs(uy * cx - ux * cy)
+        e0, e1 = np.sqrt(l0), np.sqrt(l1)
+        dx = np.maximum(z0 - e0, 0)
+        degenerate = dx * dx + z1 * z1 <= 1
+        inside = z0 * z0 / l0 + z1 * z1 / l1 <= 1
+        touch = __distance_to_axis_ellipse(e0, e1, z0, z1) <= 1
+        return near & np.where(e1 == 0, degenerate, inside | touch)
+
+
+def ellipse_line(ellipse, line):
+    """Verify collision between ellipses and line segments."""
+    x1, y1 = __to_ellipse_frame(ellipse, *line[:, 0].T)
+    x2, y2 = __to_ellipse_frame(ellipse, *line[:, 1].T)
+    return __distance_to_segment(x1, y1, x2, y2, 0, 0) <= 0.95
+
+
+def circle_rect(circle, rect):
+    """Verify collision between circles and rectangles."""
+    x, y, _, _ = rect.T
+    cx, cy, r = circle.T
+    return ((x - cx) ** 2 + (y - cy) ** 2) < r * r
+
+
+def circle_circle(c1, c2):
+    """Verify collision between circles."""
+    cx1, cy1, r1 = c1.T
+    cx2, cy2, r2 = c2.T
+    return ((cx1 - cx2) ** 2 + (cy1 - cy2) ** 2) < (r1 + r2) ** 2
+
+
+def point_rect(point, rect):
+    """Verify collision between points and rectangles."""
+    xo, yo = point.T
+    x, y, w, h = rect.T
+    return (xo >= x) & (xo <= x + w) & (yo >= y) & (yo <= y + h)
+
+
+def rect_rect(r1, r2):
+    """Verify collision between rectangles."""
+    x1, y1, w1, h1 = r1.T
+    x2, y2, w2, h2 = r2.T
+    apart = (x1 > x2 + w2) | (x1 + w1 < x2)
+    apart |= (y1 > y2 + h2) | (y1 + h1 < y2)
+    return ~apart
+
+
+def line_line(l1, l2):
+    """Verify intersection between line segments."""
+    def orientation(p, q, r):
+        cross = (q[0] - p[0]) * (r[1] - p[1])
+        return cross - (q[1] - p[1]) * (r[0] - p[0])
+
+    def overlap(a, b, c, d):
+        first = np.minimum(a, b) <= np.maximum(c, d)
+        return first & (np.minimum(c, d) <= np.maximum(a, b))
+
+    p1, p2, p3, p4 = l1[:, 0].T, l1[:, 1].T, l2[:, 0].T, l2[:, 1].T
+    d1 = orientation(p3, p4, p1)
+    d2 = orientation(p3, p4, p2)
+    d3 = orientation(p1, p2, p3)
+    d4 = orientation(p1, p2, p4)
+    collinear = (d1 == 0) & (d2 == 0) & (d3 == 0) & (d4 == 0)
+    projections = overlap(p1[0], p2[0], p3[0], p4[0])
+    projections &= overlap(p1[1], p2[1], p3[1], p4[1])
+    crossing = (d1 * d2 <= 0) & (d3 * d4 <= 0)
+    return np.where(collinear, projections, crossing)
+
+
+def line_rect(line, rect):
+    """Verify intersection between line segments and rectangles."""
+    (x1, y1), (x2, y2) = line[:, 0].T, line[:, 1].T
+    x, y, w, h = rect.T
+    dx, dy = x2 - x1, y2 - y1
+    t0 = np.zeros(len(line))
+    t1 = np.ones(len(line))
+    result = np.ones(len(line), dtype=bool)
+    for p, q in ((-dx, x1 - x), (dx, x + w - x1),
+                 (-dy, y1 - y), (dy, y + h - y1)):
+        parallel = p == 0
+        result &= ~(parallel & (q < 0))
+        t = q / np.where(parallel, 1, p)
+        t0 = np.where(~parallel & (p < 0), np.maximum(t0, t), t0)
+        t1 = np.where(~parallel & (p > 0), np.minimum(t1, t), t1)
+    return result & (t0 <= t1)
+
+
+def line_circle(line, circle):
+    """Verify intersection between line segments and circles."""
+    (x1, y1), (x2, y2) = line[:, 0].T, line[:, 1].T
+    cx, cy, r = circle.T
+    return __distance_to_segment(x1, y1, x2, y2, cx, cy) <= r * r
+
+
+# shape pair -> (kernel, operands are swapped)
+__kernels = {
+    "ellipse_rect": (ellipse_rect, False),
+    "rect_ellipse": (ellipse_rect, True),
+    "ellipse_circle": (ellipse_circle, False),
+    "circle_ellipse": (ellipse_circle, True),
+    "circle_rect": (circle_rect, False),
+    "rect_circle": (circle_rect, True),
+    "rect_rect": (rect_rect, False),
+    "circle_circle": (circle_circle, False),
+    "ellipse_ellipse": (ellipse_ellipse, False),
+    "line_line": (line_line, False),
+    "line_circle": (line_circle, False),
+    "circle_line": (line_circle, True),
+    "line_rect": (line_rect, False),
+    "rect_line": (line_rect, True),
+    "line_ellipse": (ellipse_line, True),
+    "ellipse_line": (ellipse_line, False),
+    "point_ellipse": (ellipse_point, True),
+    "ellipse_point": (ellipse_point, False),
+    "point_rect": (point_rect, False),
+    "rect_point": (point_rect, True),
+}
+
+
+def collide_pairs(colliders, pairs, threshold=64):
+    """Return a list with the result of the collision test of each pair.
+
+    Pairs of the same shapes are tested with a single kernel call when
+    there are at least `threshold` of them, and one by one otherwise.
+    """
+    groups = {}
+    for n, (i, j) in enumerate(pairs):
+        shapes = (colliders[i].bounding_shape, colliders[j].bounding_shape)
+        group = groups.get(shapes)
+        if group is None:
+            groups[shapes] = [n]
+        else:
+            group.append(n)
+    result = [False] * len(pairs)
+    for shapes, group in groups.items():
+        kernel, swap = __kernels.get("_".join(shapes), (None, False))
+        if kernel is None or threshold is None or len(group) < threshold:
+            for n in group:
+                i, j = pairs[n]
+                result[n] = colliders[i].did_collide(colliders[j])
+            continue
+        first = [colliders[pairs[n][0]].collision_bounds for n in group]
+        second = [colliders[pairs[n][1]].collision_bounds for n in group]
+        first = np.array(first, dtype=float)
+        second = np.array(second, dtype=float)
+        if swap:
+            first, second = second, first
+        for n, hit in zip(group, kernel(first, second).tolist()):
+            result[n] = hit
+    return result
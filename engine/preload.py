@@ -0,0 +1,68 @@
+"""Load scene assets in background threads, before the scene starts."""
+
+from .assets import get_image, load_sound
+from .lib.GIFImage import GIFFrames
+
+from concurrent.futures import ThreadPoolExecutor
+import pygame
+
+
+class Preloader:
+    """Load the assets of scenes in background threads.
+
+    A scene declares its assets in the 'assets' entry, with lists of
+    'images' and 'animations'. Each asset is a filename or a tuple
+    (filename, parameters), with the same parameters used by Sprite, like
+    scale, rotate, shadow, time_scale and cache_frames. Files in the
+    scene 'audio' entry are also loaded.
+    """
+
+    def __init__(self, workers=2):
+        """Initialize the preloader with the given number of threads."""
+        self.__executor = ThreadPoolExecutor(max_workers=workers)
+        # pending loads, by scene name
+        self.__pending = {}
+
+    @staticmethod
+    def __assets(config, kind):
+        for asset in config.get('assets', {}).get(kind, []):
+            if isinstance(asset, str):
+                yield asset, {}
+            else:
+                yield asset
+
+    @staticmethod
+    def __load_image(filename, scale=1, rotate=0, shadow=None):
+        get_image(filename, scale, rotate, shadow)
+
+    @staticmethod
+    def __load_animation(filename, scale=1.0, time_scale=1.0, shadow=None,
+                         cache_frames=None):
+        frames = GIFFrames.get(filename, scale, time_scale, cache_frames)
+        if shadow is not None and cache_frames is None:
+            for index in range(len(frames)):
+                frames.frame(index, shadow)
+
+    def preload(self, config):
+        """Start loading the assets of a scene, if not already loading."""
+        name = config['name']
+        if name in self.__pending:
+            return
+        submit = self.__executor.submit
+        jobs = []
+        audio = config.get('audio', {})
+        if audio and not pygame.mixer.get_init():
+            pygame.mixer.init()
+        for description in audio.values():
+            jobs.append(submit(load_sound, description['filename']))
+        for filename, params in Preloader.__assets(config, 'images'):
+            jobs.append(submit(Preloader.__load_image, filename, **params))
+        for filename, params in Preloader.__assets(config, 'animations'):
+            jobs.append(submit(Preloader.__load_animation, filename, **params))
+        self.__pending[name] = jobs
+
+    def wait(self, name):
+        """Wait until the assets of a scene are loaded."""
+        for job in self.__pending.pop(name, []):
+            # raise any error found while loading.
+            job.result()
@@ -0,0 +1,138 @@
+"""Measure the time spent in each phase of the game loop."""
+
+from collections import deque
+from time import perf_counter
+
+
+def percentile(values, p):
+    """Return the p-th percentile of values, interpolating linearly."""
+    values = sorted(values)
+    if not values:
+        return 0
+    k = (len(values) - 1) * p / 100
+    i = int(k)
+    j = min(i + 1, len(values) - 1)
+    return values[i] + (values[j] - values[i]) * (k - i)
+
+
+class Profiler:
+    """Keep the time spent in each phase of the most recent frames.
+
+    The game loop calls lap() at the end of each phase, adding the time
+    since the previous lap to that phase, and end_frame() once the frame
+    is done. Times are stored in miliseconds, and each frame also has the
+    'busy' time, spent in every phase but waiting, and the 'total' time.
+    """
+
+    PHASES = ("events", "frame", "collisions", "update", "draw",
+              "display", "wait")
+    # phases doing work, i.e., not waiting for the frame rate.
+    BUSY = PHASES[:-1]
+
+    def __init__(self, size=120):
+        """Initialize the profiler, keeping the given number of frames."""
+        self.__frames = deque(maxlen=size)
+        self.start()
+
+    def start(self):
+        """Start measuring a new frame."""
+        self.__current = dict.fromkeys(Profiler.PHASES, 0.0)
+        self.__mark = perf_counter()
+
+    def lap(self, phase):
+        """Add the time elapsed since the last lap to the given phase."""
+        now = perf_counter()
+        self.__current[phase] += (now - self.__mark) * 1000
+        self.__mark = now
+
+    def end_frame(self, **counters):
+        """Store the current frame, with counters like the object count."""
+        frame = self.__current
+        frame['busy'] = sum(frame[p] for p in Profiler.BUSY)
+        frame['total'] = frame['busy'] + frame['wait']
+        frame.update(counters)
+        self.__frames.append(frame)
+        self.start()
+
+    def percentile(self, phase, p):
+        """Return the p-th percentile of a phase in the recent frames."""
+        return percentile([f[phase] for f in self.__frames], p)
+
+    def summary(self):
+        """Return mean, median, 95th percentile and maximum of each phase."""
+        result = {}
+        count = len(self.__frames) or 1
+        for phase in Profiler.PHASES + ('busy', 'total'):
+            values = [f[phase] for f in self.__frames]
+            result[phase] = {
+                "mean": sum(values) / count,
+                "p50": self.percentile(phase, 50),
+                "p95": self.percentile(phase, 95),
+                "max": max(values, default=0),
+            }
+        return result
+
+    def slowest(self, frame=None):
+        """Return the busy phase that took longest in a frame (or the last)."""
+        frame = self.last if frame is None else frame
+        return max(Profiler.BUSY, key=frame.get) if frame else None
+
+    def over_budget(self, budget=1000 / 60):
+        """Return (busy time, slowest phase) of frames over the budget."""
+        return [(f['busy'], self.slowest(f))
+                for f in self.__frames if f['busy'] > budget]
+
+    @property
+    def frames(self):
+        """Return the recent frames, from the oldest to the newest."""
+        return list(self.__frames)
+
+    @property
+    def last(self):
+        """Return the most recent frame, or None."""
+        return self.__frames[-1] if self.__frames else None
+
+    @property
+    def fps(self):
+        """Return the frame rate measured over the recent frames."""
+        total = sum(f['total'] for f in self.__frames)
+        return len(self.__frames) * 1000 / total if total > 0 else 0
+
+
+class ProfilerOverlay:
+    """Show frame rate, object count and collision pairs on screen."""
+
+    def __init__(self, profiler, font, position=(10, 10), **kwargs):
+        """
+        Initialize the overlay.
+
+        Optional keyword arguments:
+            - color: text color. (Default: (255, 255, 0))
+            - refresh: number of frames between text updates. (Default: 30)
+        """
+        self.__profiler = profiler
+        self.__font = font
+        self.__position = position
+        self.__color = kwargs.get('color', (255, 255, 0))
+        self.__refresh = kwargs.get('refresh', 30)
+        self.__count = 0
+        self.__text = None
+
+    def __format(self):
+        profiler = self.__profiler
+        last = profiler.last
+        slowest = profiler.slowest()
+        return "{:.0f} fps  {:.1f} ms ({} {:.1f})  {} objs  {} pairs".format(
+            profiler.fps, profiler.percentile('busy', 95), slowest,
+            last[slowest], last.get('objects', 0), last.get('pairs', 0))
+
+    def draw(self, screen):
+        """Draw the overlay, updating the text when needed."""
+        if self.__profiler.last is None:
+            return []
+        if self.__text is None or self.__count >= self.__refresh:
+            self.__text = self.__format()
+            self.__count = 0
+        self.__count += 1
+        return self.__font.draw(screen, self.__text, self.__position,
+                                self.__color)
@@ -2,15 +2,21 @@
 
 from .gameobject import GameObject
 from .collider import Collider
+from .displaylist import DisplayList
+from .broadphase import create_broadphase
+from .narrowphase import collide_pairs
 from .audio import Mixer
-from .behaviors import NonRemovable
+from .behaviors import NonRemovable, Movable
 from .functions import Command
-from .util import (get_value, list_reverse, Bindable, Self,
+from .util import (get_value, Bindable, Self,
                    ValueReference, TheGame, GameVariable)
 
 from util.notifications import after, before
 
+from collections import defaultdict
+import heapq
 import importlib
+import itertools
 
 
 class SceneObject(ValueReference):
@@ -54,30 +60,61 @@ class SceneEvent:
 class Scene:
     """Models a game scene."""
 
+    # object classes, by their full name
+    __classes = {}
+
     def __init__(self, game, config):
         """Initialize the Scene objects."""
+        from .game import GameFont
+        self.__GameFont = GameFont
+        # parameters that are resolved every time an object is created.
+        self.__dynamic = (Command, SceneObject, SceneBehavior, SceneEvent,
+                          GameFont, TheGame, GameVariable)
+        # compiled object descriptions, by name
+        self.__factories = {}
         self.name = config['name']
         self.__object_configuration = {}
-        self.__game_objects = []
+        self.__game_objects = DisplayList()
+        # scene objects by name and by class, as {id(object): object}
+        self.__names = defaultdict(dict)
+        self.__types = defaultdict(dict)
+        # scheduled events, a heap of (due time, sequence, repeat, event).
         self.__events = []
+        self.__sequence = itertools.count()
         self.__keys = set()
         self.game = game
         self.mixer = Mixer(get_value(config, 'mixer.config', {}))
         self.__mixer_config = {}
         # configure audio
         self.__load_audio(get_value(config, 'audio', {}))
+        # collision detection
+        self.__broadphase = create_broadphase(config.get('collision', {}))
+        self.__batch_threshold = get_value(config,
+                                           'collision.batch_threshold', 64)
+        layers = get_value(config, 'collision.layers', [])
+        self.__layers = {name: 1 << bit for bit, name in enumerate(layers, 1)}
+        self.__collision_pairs = 0
         # scene object descriptions
         self.__object_configuration = config.get('objects', {})
+        # removed objects kept for reuse, by object name
+        self.__pools = {}
+        for name, description in self.__object_configuration.items():
+            pool = description.get('pool', 0) \
+                if isinstance(description, dict) else 0
+            if pool > 0:
+                self.__pools[name] = []
         # next scenes
         self.__next_scene = config.get('next_scene', {})
+        self.__frame = 0
+        self.__time = 0
         # create events (when, recurrence, event, *args, **kwargs)
-        self.__events = [(-1, 0, *e) for e in config.get('before', [])]
-        self.__events.extend([e for e in config.get('events', [])])
+        for e in config.get('before', []):
+            self.queue_event(-1, 0, *e)
+        for e in config.get('events', []):
+            self.queue_event(*e)
         self.stop = False
         self.key_events = config.get('on_key', set())
         self.__behaviors = config.get('behaviors', set())
-        self.__frame = 0
-        self.__time = 0
 
     def __load_audio(self, config):
         for name, description in config.items():
@@ -87,56 +124,103 @@ class Scene:
             self.mixer.add(name, filename)
             self.__mixer_config[name] = {"loop": loop, "autostart": autostart}
 
+    def __layer_bits(self, names):
+        if isinstance(names, str):
+            names = [names]
+        bits = 0
+        for name in names:
+            try:
+                bits |= self.__layers[name]
+            except KeyError as e:
+                msg = "Unknown collision layer: {}".format(name)
+                raise Exception(msg) from e
+        return bits
+
+    def __set_layers(self, obj, layers):
+        category = self.__layer_bits(layers['category'])
+        mask = layers.get('mask', None)
+        mask = Collider.ALL_LAYERS if mask is None \
+            else self.__layer_bits(mask)
+        obj.set_layers(category, mask)
+
     def __get_class(self, obj_class):
-        module, classname = obj_class.rsplit('.', 1)
-        return getattr(importlib.import_module(module), classname)
+        cls = Scene.__classes.get(obj_class)
+        if cls is None:
+            module, classname = obj_class.rsplit('.', 1)
+            cls = getattr(importlib.import_module(module), classname)
+            Scene.__classes[obj_class] = cls
+        return cls
+
+    def __process_parameter(self, param):
+        if isinstance(param, TheGame):
+            return param()
+        if isinstance(param, Command):
+            return self.__process_parameter(param())
+        elif isinstance(param, SceneObject):
+            return self.get_object(self.__process_parameter(param()))
+        elif isinstance(param, SceneBehavior):
+            name = self.__process_parameter(param())
+            behavior = self.__behaviors[name]
+            return self.__load_object(name, behavior)
+        elif isinstance(param, SceneEvent):
+            return SceneEvent(self, *param)
+        elif isinstance(param, self.__GameFont):
+            return self.game.get_font(param())
+        elif isinstance(param, GameVariable):
+            return self.game.get_variable(param())
+        else:
+            return param
+
+    def __split_params(self, init):
+        """Split init parameters in static ones and ones to be resolved."""
+        static, dynamic = {}, []
+        for k, v in init.items():
+            if isinstance(v, self.__dynamic) or \
+                    (isinstance(v, dict) and 'class' in v):
+                dynamic.append((k, v))
+            else:
+                static[k] = v
+        return static, dynamic
+
+    def __compile(self, name, description):
+        """Return the object factory (class, static, dynamic) of an object."""
+        entry = self.__factories.get(name)
+        if entry is not None and entry[0] is description:
+            return entry[1]
+        cls = self.__get_class(description['class'])
+        factory = (cls, *self.__split_params(description.get('init', {})))
+        self.__factories[name] = (description, factory)
+        return factory
+
+    def __init_params(self, name, description, **kwargs):
+        cls, static, dynamic = self.__compile(name, description)
+        if 'init' in kwargs:
+            static, dynamic = self.__split_params(kwargs['init'])
+        params = static.copy()
+        for k, v in dynamic:
+            if isinstance(v, dict):
+                params[k] = self.__load_object(k, v)
+            else:
+                params[k] = self.__process_parameter(v)
+        return cls, params
 
     def __load_object(self, name, description, **kwargs):
-        from .game import GameFont
-
         def bind_key_event(k, fn, which):
             if isinstance(fn, str):
                 fn = getattr(obj, fn)
             self.__keys.add(k)
             which(k, fn)
 
-        def process_scene_parameter(param):
-            if isinstance(param, TheGame):
-                return param()
-            if isinstance(param, Command):
-                return process_scene_parameter(param())
-            elif isinstance(param, SceneObject):
-                return self.get_object(process_scene_parameter(param()))
-            elif isinstance(param, SceneBehavior):
-                name = process_scene_parameter(param())
-                behavior = self.__behaviors[name]
-                return self.__load_object(name, behavior)
-            elif isinstance(param, SceneEvent):
-                return SceneEvent(self, *param)
-            elif isinstance(param, GameFont):
-                return self.game.get_font(param())
-            elif isinstance(param, GameVariable):
-                return self.game.get_variable(param())
-            else:
-                return param
-
-        cls = self.__get_class(description['class'])
-        params = kwargs.get('init', description.get('init', {})).copy()
-        classes = (Command, SceneObject, SceneBehavior, SceneEvent,
-                   GameFont, TheGame, GameVariable)
-        for k, v in params.items():
-            if isinstance(v, dict):
-                if 'class' in v:
-                    params[k] = self.__load_object(v)
-                else:
-                    params[k] = v
-            elif isinstance(v, classes):
-                params[k] = process_scene_parameter(v)
+        cls, params = self.__init_params(name, description, **kwargs)
         try:
             obj = cls(**params)
         except Exception as e:
             msg = "Error instantiating '{class}'\n\t{e}"
             raise Exception(msg.format(e=e, **description)) from e
+        # Set collision layers.
+        layers = kwargs.get('collision', description.get('collision', None))
+        if layers is not None and isinstance(obj, Collider):
+            self.__set_layers(obj, layers)
         # TODO: Rename.
         for m, bind, fn in description.get('notifications', []):
             meth = getattr(obj, m)
@@ -162,60 +246,123 @@ class Scene:
         self.game.bind_variables(name, obj)
         return obj
 
+    def __reuse_object(self, obj, name, description, **kwargs):
+        """Reinitialize a pooled object, keeping its bindings."""
+        reset = getattr(obj, 'reset', None)
+        if reset is None:
+            msg = "Pooled object '{}' must implement reset()."
+            raise Exception(msg.format(name))
+        _, params = self.__init_params(name, description, **kwargs)
+        try:
+            reset(**params)
+        except Exception as e:
+            msg = "Error reinitializing '{class}'\n\t{e}"
+            raise Exception(msg.format(e=e, **description)) from e
+        layers = kwargs.get('collision', description.get('collision', None))
+        if layers is not None and isinstance(obj, Collider):
+            self.__set_layers(obj, layers)
+        return obj
+
     def verify_collisions(self):
         """Verify collision in scene objects."""
-        for i, (_, src) in enumerate(self.__game_objects):
-            if isinstance(src, Collider) and src.should_collide:
-                for (_, obj) in self.__game_objects[i + 1:]:
-                    if isinstance(obj, Collider) and obj.should_collide:
-                        if src.did_collide(obj):
-                            src.collide_with(obj)
-                            obj.collide_with(src)
+        colliders = [o for (_, o) in self.__game_objects
+                     if isinstance(o, Collider) and o.should_collide]
+        pairs = [(i, j) for i, j in self.__broadphase.pairs(colliders)
+                 if colliders[i].interacts_with(colliders[j])]
+        self.__collision_pairs = len(pairs)
+        # geometry does not change while handling collisions, so all
+        # pairs can be tested before any handler is called.
+        hits = collide_pairs(colliders, pairs, self.__batch_threshold)
+        for (i, j), hit in zip(pairs, hits):
+            src, obj = colliders[i], colliders[j]
+            if hit and src.should_collide and obj.should_collide:
+                src.collide_with(obj)
+                obj.collide_with(src)
 
     def get_object_list(self, name):
         """Retrieve a list of objects with the same name."""
-        return [o for (n, o) in self.__game_objects if n == name]
+        objects = self.__names.get(name)
+        return list(objects.values()) if objects else []
+
+    def get_objects_of_class(self, cls):
+        """Retrieve a list of the objects that are instances of a class."""
+        return [o for c, objects in self.__types.items()
+                if issubclass(c, cls) for o in objects.values()]
 
     def get_object(self, name):
         """Retrieve an object or object description."""
-        ol = self.get_object_list(name)
-        if len(ol) == 0:
+        objects = self.__names.get(name)
+        if not objects:
             return None
-        if len(ol) > 1:
+        if len(objects) > 1:
             error = "Requested one object, found many: {}"
             raise Exception(error.format(name))
-        return ol[0]
+        return next(iter(objects.values()))
+
+    def __index(self, name, obj):
+        """Add an object to the name and class indexes."""
+        self.__names[name][id(obj)] = obj
+        self.__types[type(obj)][id(obj)] = obj
+
+    def __unindex(self, name, obj):
+        """Remove an object from the name and class indexes."""
+        self.__names[name].pop(id(obj), None)
+        self.__types[type(obj)].pop(id(obj), None)
 
     def update_objects(self, bounds):
         """Update game objects within bounds."""
         for (_, object) in self.__game_objects:
+            if isinstance(object, Movable):
+                object.save_position()
             object.update(bounds)
-        self.__game_objects = [(n, o) for (n, o) in self.__game_objects
-                               if (isinstance(o, NonRemovable) or
-                               not hasattr(o, 'visible') or o.visible) and
-                               not o.can_eliminate]
+        removed = self.__game_objects.remove_if(Scene.__removable)
+        for (n, o) in removed:
+            self.__unindex(n, o)
+            if n in self.__pools:
+                self.__release(n, o)
+
+    @staticmethod
+    def __removable(name, obj):
+        """Check if an object should be removed from the scene."""
+        if isinstance(obj, NonRemovable):
+            return obj.can_eliminate
+        hidden = hasattr(obj, 'visible') and not obj.visible
+        return hidden or obj.can_eliminate
+
+    def __release(self, name, obj):
+        """Keep a removed object for reuse, if its pool is not full."""
+        pool = self.__pools[name]
+        if len(pool) < self.__object_configuration[name]['pool']:
+            pool.append(obj)
 
     def draw(self, window):
         """Draw scene on window."""
-        for (_, object) in list_reverse(self.__game_objects):
+        for (_, object) in reversed(self.__game_objects):
             window.draw(object)
 
     def frame(self, count, elapsed):
-        """Handle new frame event."""
+        """Handle new frame event, executing the events that are due."""
         self.__frame = count
         self.__time += elapsed
-        self.__events.sort(key=lambda e: int(e[0]))
-        for i, (t, n, *e) in enumerate(self.__events):
-            t -= elapsed
-            if t <= 0:
-                self.event(*e)
-                t = n
-            self.__events[i] = (t, n, *e)
-        self.__events = [(t, *e) for t, *e in self.__events if t > 0]
+        events = self.__events
+        while events and events[0][0] <= self.__time:
+            _, _, repeat, event = heapq.heappop(events)
+            self.event(*event)
+            if repeat > 0:
+                entry = (self.__time + repeat, next(self.__sequence),
+                         repeat, event)
+                heapq.heappush(events, entry)
 
     def queue_event(self, time, repeat, event, *args, **kwargs):
-        """Queue an event to the scene."""
-        self.__events.append((time, repeat, event, *args))
+        """Queue an event to be executed after time miliseconds.
+
+        If repeat is greater than zero, the event is executed again every
+        repeat miliseconds. Events with the same due time are executed in
+        the order they were queued.
+        """
+        entry = (self.__time + time, next(self.__sequence), repeat,
+                 (event, *args))
+        heapq.heappush(self.__events, entry)
 
     def event(self, func, *args, **kwargs):
         """Execute a scene event."""
@@ -228,18 +375,20 @@ class Scene:
             # add object
             obj_desc = self.__object_configuration[obj_name]
             if isinstance(obj_desc, GameObject):
-                self.__game_objects.append((obj_name, obj_desc))
+                obj = obj_desc
+            elif self.__pools.get(obj_name):
+                obj = self.__pools[obj_name].pop()
+                obj = self.__reuse_object(obj, obj_name, obj_desc, **kwargs)
             else:
                 obj = self.__load_object(obj_name, obj_desc, **kwargs)
-                self.__game_objects.append((obj_name, obj))
+            self.__game_objects.add(obj_name, obj)
+            self.__index(obj_name, obj)
         if isinstance(objects, str):
             add_object(objects)
         else:
             for object_name in objects:
                 add_object(object_name)
 
-        self.__game_objects.sort(key=lambda go: go[1].priority)
-
     def _play_audio(self, music):
         try:
             cfg = self.__mixer_config[music]
@@ -277,6 +426,16 @@ class Scene:
         """Query the next scenes."""
         return self.__next_scene
 
+    @property
+    def object_count(self):
+        """Query the number of objects in the scene."""
+        return len(self.__game_objects)
+
+    @property
+    def collision_pairs(self):
+        """Query the number of pairs tested in the last collision check."""
+        return self.__collision_pairs
+
     @property
     def elapsed(self):
         """Query the number of frames executed and the elapsed time."""
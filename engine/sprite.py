@@ -1,8 +1,7 @@
 """Define the Sprite class."""
 
-import pygame
+from .assets import load_image, get_image, get_mask
 from .lib.GIFImage import GIFImage
-from .lib.shadows import add_shadow
 
 
 class Sprite:
@@ -10,6 +9,8 @@ class Sprite:
 
     def __init__(self, image, **kw):
         """Initialize a sprite object."""
+        self.__filename = image
+        self.__mask = None
         scale = self.__scale = kw.get('scale', 1)
         ang = self.__rotation = kw.get('rotate', 0)
         self.__animate = kw.get('animate', False)
@@ -18,34 +19,46 @@ class Sprite:
             self.__image = GIFImage(image, **kw)
             x, y, w, h = self.__image.get_rect()
         else:
-            self.__image = pygame.image.load(image)
-            _, _, w, h = self.__image.get_rect()
+            original = load_image(image)
+            _, _, w, h = original.get_rect()
             w *= scale
             h *= scale
-            cx, cy = self.__image.get_rect().center
-            self.__image = pygame.transform.rotozoom(self.__image, ang, scale)
-            x, y, a, b = self.__image.get_rect(center=(cx, cy))
-            self.__image.get_rect().center = (x + a // 2, y + b // 2)
-            blt = self.__image
-            if self.__shadow:
-                offset, scale, amb = self.__shadow
-                blt = add_shadow(blt, offset, shadow_scale=scale, ambience=amb)
-            self.__image = blt
+            cx, cy = original.get_rect().center
+            plain = get_image(image, scale, ang)
+            self.__image = get_image(image, scale, ang, self.__shadow)
+            # the shadow makes the image larger, place it as the plain one.
+            x, y, a, b = plain.get_rect(center=(cx, cy))
         self.__bounds = (x, y, w, h, ang, scale)
 
     def draw(self, screen, position):
         """Draw the sprite to the screen."""
         pos = list(map(int, position))
         if self.__animate:
-            self.__image.draw(screen, pos)
+            return self.__image.draw(screen, pos)
         else:
-            screen.blit(self.__image, pos)
+            return screen.blit(self.__image, pos)
+
+    def restart(self):
+        """Restart the animation from the first frame."""
+        if self.__animate:
+            self.__image.reset()
+            self.__image.play()
 
     @property
     def bounds(self):
         """Compute sprite bounds."""
         return self.__bounds
 
+    @property
+    def mask(self):
+        """Return the collision mask of the sprite image, without shadow."""
+        if self.__animate:
+            return self.__image.mask
+        if self.__mask is None:
+            self.__mask = get_mask(self.__filename, self.__scale,
+                                   self.__rotation)
+        return self.__mask
+
     @property
     def center(self):
         """Return  sprite center."""
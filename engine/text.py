@@ -2,8 +2,11 @@
 
 import pygame
 
+from .assets import convert
 from .gameobject import GameObject
 
+from collections import OrderedDict
+
 
 class Label(GameObject):
     """Models an UI text object."""
@@ -39,7 +42,8 @@ class Label(GameObject):
     def draw(self, screen):
         """Draw on the screen."""
         if self.visible and self.__blink_state:
-            screen.blit(self.__surface, self.__rect)
+            return screen.blit(self.__surface, self.__rect)
+        return []
 
     def blink(self, *args, **kwargs):
         """Toggle blink state."""
@@ -57,22 +61,86 @@ class Label(GameObject):
 
 
 class Font:
-    """Models a Text Font to use on the game."""
+    """Models a Text Font to use on the game.
+
+    Glyphs are rendered once for each color, and kept in an atlas with
+    their advances. Text is composed from the atlas glyphs, with a single
+    Surface.blits call, and the most recently rendered strings are cached.
+    """
 
     REGULAR = (False, False)
     BOLD = (True, False)
     ITALIC = (False, True)
     BOLDITALIC = (True, True)
 
+    CACHE_SIZE = 64
+
     def __init__(self, filename, size, modifiers=REGULAR):
         """Initialize font object."""
         self.__font = pygame.font.Font(filename, size)
-
-    def __create_surface(self, text, **kwargs):
-        color = kwargs.get('color', (255, 255, 255))
-        surface = self.__font.render(text, True, color)
-        return surface, surface.get_rect()
+        # glyph surfaces, by color and character
+        self.__atlas = {}
+        # rendered strings, by (text, color), least recently used first
+        self.__cache = OrderedDict()
+
+    def __glyphs(self, text, color):
+        """Retrieve the glyphs of a text, rendering the missing ones.
+
+        A glyph is (surface, offset, advance), where the offset is where
+        the surface is drawn from the pen position, and the advance is how
+        much the pen moves after it.
+        """
+        atlas = self.__atlas.get(color)
+        if atlas is None:
+            atlas = self.__atlas[color] = {}
+        glyphs = []
+        for char in text:
+            glyph = atlas.get(char)
+            if glyph is None:
+                surface = convert(self.__font.render(char, True, color))
+                metrics = self.__font.metrics(char)[0]
+                if metrics is None:
+                    glyph = (surface, 0, surface.get_width())
+                else:
+                    minx, _, _, _, advance = metrics
+                    # glyphs reaching left of the pen are rendered shifted.
+                    glyph = (surface, min(minx, 0), advance)
+                atlas[char] = glyph
+            glyphs.append(glyph)
+        return glyphs
+
+    @staticmethod
+    def __layout(glyphs, x, y):
+        """Return the sequence to blit glyphs from (x, y)."""
+        sequence = []
+        for surface, offset, advance in glyphs:
+            sequence.append((surface, (x + offset, y)))
+            x += advance
+        return sequence
+
+    def size(self, text):
+        """Retrieve the size of a rendered text."""
+        return self.__font.size(text)
+
+    def draw(self, surface, text, position, color=(255, 255, 255)):
+        """Draw a text directly on a surface, returning the changed rect."""
+        x, y = position
+        glyphs = self.__glyphs(text, tuple(color))
+        surface.blits(Font.__layout(glyphs, x, y), doreturn=False)
+        return pygame.Rect(x, y, *self.__font.size(text))
 
     def render(self, text, **kwargs):
         """Render a text with the given color."""
-        return self.__create_surface(text, **kwargs)
+        key = (text, tuple(kwargs.get('color', (255, 255, 255))))
+        surface = self.__cache.get(key)
+        if surface is None:
+            sequence = Font.__layout(self.__glyphs(*key), 0, 0)
+            size = self.__font.size(text)
+            surface = pygame.Surface(size, pygame.SRCALPHA)
+            surface.blits(sequence, doreturn=False)
+            self.__cache[key] = surface
+            if len(self.__cache) > Font.CACHE_SIZE:
+                self.__cache.popitem(last=False)
+        else:
+            self.__cache.move_to_end(key)
+        return surface, surface.get_rect()
@@ -22,7 +22,6 @@ def list_reverse(lst):
     while c > 0:
         c -= 1
         yield lst[c]
-    raise StopIteration
 
 
 class Command:
@@ -17,6 +17,8 @@ class Window:
             - name: window name and caption.
             - cursor: True if mouse is to be shown. (Default: False)
             - fullscreen: True if game is to run fullscreen. (Default: False)
+            - dirty_rects: True to clear and update only the areas changed
+                           by drawn objects. (Default: False)
         """
         io = pygame.display.Info()
         x_res = kwargs.get('x_res', io.current_w)
@@ -33,14 +35,54 @@ class Window:
         w, h = self.size
         self.bounds = (0, 0, w, h)
         pygame.display.set_caption(name)
+        # areas changed in the current and in the previous frame, None
+        # if the whole screen must be updated.
+        self.__dirty_rects = kwargs.get('dirty_rects', False)
+        self.__changed = None
+        self.__previous = None
 
     def draw(self, object):
         """Asks the object to draw itself on the window canvas."""
-        object.draw(self.__screen)
+        rects = object.draw(self.__screen)
+        if self.__changed is None:
+            return
+        if rects is None:
+            self.__changed = None
+        elif isinstance(rects, pygame.Rect):
+            self.__changed.append(rects)
+        else:
+            self.__changed.extend(rects)
 
     def clear(self, color=(0, 0, 0)):
-        """Clear the window with the given color."""
-        self.__screen.fill(color)
+        """Clear the window with the given color.
+
+        With dirty rectangles, only the areas changed in the last frame
+        are cleared.
+        """
+        if self.__dirty_rects and self.__previous is not None:
+            for rect in self.__previous:
+                self.__screen.fill(color, rect)
+        else:
+            self.__screen.fill(color)
+        self.__changed = [] if self.__dirty_rects else None
+
+    def update(self):
+        """Show the drawn frame on the display.
+
+        With dirty rectangles, only the areas changed in this frame or in
+        the last one are updated.
+        """
+        changed = self.__changed
+        if changed is None or self.__previous is None:
+            pygame.display.update()
+        else:
+            pygame.display.update(self.__previous + changed)
+        self.__previous = changed
+        self.__changed = None
+
+    def invalidate(self):
+        """Force the next frame to clear and update the whole window."""
+        self.__previous = None
 
     @property
     def size(self):
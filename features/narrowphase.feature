@@ -0,0 +1,31 @@
+Feature: Vectorized narrow phase
+  The narrow phase kernels test many pairs of shapes at once, and must
+  give the same results as the collision functions of Collider.
+
+  Scenario Outline: Kernels match the collider functions
+    Given 2000 random pairs of <first> and <second> shapes
+    When the pairs are tested by the narrow phase kernel
+    Then the results are the same as the collider functions
+
+    Examples:
+      | first   | second  |
+      | ellipse | rect    |
+      | rect    | ellipse |
+      | ellipse | circle  |
+      | circle  | ellipse |
+      | circle  | rect    |
+      | rect    | circle  |
+      | rect    | rect    |
+      | circle  | circle  |
+      | ellipse | ellipse |
+      | line    | line    |
+      | line    | circle  |
+      | circle  | line    |
+      | line    | rect    |
+      | rect    | line    |
+      | line    | ellipse |
+      | ellipse | line    |
+      | point   | ellipse |
+      | ellipse | point   |
+      | point   | rect    |
+      | rect    | point   |
@@ -0,0 +1,83 @@
+"""Steps comparing the narrow phase kernels with Collider."""
+
+from behave import given, when, then
+
+from engine import Collider
+from engine import narrowphase
+
+from random import Random
+import numpy as np
+
+
+def random_ellipse(rng):
+    """Create ellipse bounds, extended with the rotation terms."""
+    angle = rng.randrange(0, 360)
+    bounds = (rng.randint(0, 100), rng.randint(0, 100),
+              rng.randint(2, 60), rng.randint(2, 60), angle)
+    return bounds + Collider.rotation_terms(angle)
+
+
+def random_rect(rng):
+    """Create rectangle bounds."""
+    return (rng.randint(0, 100), rng.randint(0, 100),
+            rng.randint(0, 50), rng.randint(0, 50))
+
+
+def random_circle(rng):
+    """Create circle bounds."""
+    return (rng.randint(0, 100), rng.randint(0, 100), rng.randint(1, 30))
+
+
+def random_line(rng):
+    """Create line segment bounds."""
+    return ((rng.randint(0, 100), rng.randint(0, 100)),
+            (rng.randint(0, 100), rng.randint(0, 100)))
+
+
+def random_point(rng):
+    """Create point bounds."""
+    return (rng.randint(0, 100), rng.randint(0, 100))
+
+
+SHAPES = {
+    Collider.ELLIPSE: random_ellipse,
+    Collider.RECT: random_rect,
+    Collider.CIRCLE: random_circle,
+    Collider.LINE: random_line,
+    Collider.POINT: random_point,
+}
+
+
+@given('{count:d} random pairs of {first} and {second} shapes')
+def step_random_pairs(context, count, first, second):
+    """Create random pairs of shapes, with a fixed seed."""
+    rng = Random(count)
+    context.shapes = "{}_{}".format(first, second)
+    context.pairs = [(SHAPES[first](rng), SHAPES[second](rng))
+                     for _ in range(count)]
+
+
+@when('the pairs are tested by the narrow phase kernel')
+def step_test_kernel(context):
+    """Run the kernel of the shapes on every pair."""
+    kernels = getattr(narrowphase, '__kernels')
+    kernel, swap = kernels[context.shapes]
+    first = np.array([a for a, _ in context.pairs], dtype=float)
+    second = np.array([b for _, b in context.pairs], dtype=float)
+    if swap:
+        first, second = second, first
+    context.result = kernel(first, second).tolist()
+
+
+@then('the results are the same as the collider functions')
+def step_compare(context):
+    """Compare the kernel results with the scalar functions."""
+    function = Collider._Collider__functions[context.shapes]
+    expected = [bool(function(a, b)) for a, b in context.pairs]
+    mismatches = [pair for pair, hit, result
+                  in zip(context.pairs, expected, context.result)
+                  if hit != result]
+    assert not mismatches, "{} mismatches, like {}".format(
+        len(mismatches), mismatches[:3])
+    # the shapes must both hit and miss to be meaningful.
+    assert any(expected) and not all(expected)
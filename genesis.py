@@ -16,7 +16,10 @@ pygame.init()
 if __name__ == "__main__":
     options = cli_parser.proccess_CLI()
 
-    game = Game(stages.genesis.Genesis)
+    script = stages.genesis.Genesis
+    if options.stats:
+        script = dict(script, profile={"overlay": {"font": "military.normal"}})
+    game = Game(script, headless=options.headless)
 
     config.canvas_size = game.window.size
 
@@ -29,7 +32,11 @@ if __name__ == "__main__":
     game.add_scene(stages.intro.create_scene(game_config))
     game.add_scene(stages.gameover.create_scene(game_config))
     game.add_scene(stages.stage1.create_scene(game_config))
-    game.run("intro")
+    if options.frames is None:
+        game.run(options.scene)
+    else:
+        game.start(options.scene)
+        game.step(options.frames)
 
 
 # def update_score_enemy(sender, scene):
@@ -54,6 +61,10 @@ def enemy_shoot(scene):
                             "color": color,
                             "size": 8,
                             "ignore_colision": (Enemy,),
+                        },
+                        collision={
+                            "category": "enemy_shot",
+                            "mask": ["player"]
                         })
             scene.event("play_audio", "player_shoot")
 
@@ -2,6 +2,7 @@
 
 from .enemy import Enemy             # noqa: F401
 from .explosion import Explosion     # noqa: F401
+from .parallax import ParallaxBackground  # noqa: F401
 from .player import Player           # noqa: F401
 from .projectile import Projectile   # noqa: F401
 from .starfield import Starfield     # noqa: F401
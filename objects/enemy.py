@@ -14,14 +14,27 @@ class Enemy(Controllable, Collider, Movable, GameObject):
 
     def __init__(self, canvas, image, **kw):
         """Initialize Enemy object."""
+        Collider.__init__(self, kw.get('bounding_shape', Collider.RECT))
+        GameObject.__init__(self, kw.get('priority', GameObject.Priority.NPC))
+        self.__start(canvas, **kw)
+        self.__sprite = Sprite(image, **kw)
+        x, y, *_ = self.__sprite.bounds
+        self.move(x, y)
+
+    def __start(self, canvas, **kw):
+        """Set the controller and the initial position of the enemy."""
         Controllable.__init__(self,
                               kw.get('controller',
                                      ConstantController(-1, 0)))
-        Collider.__init__(self, kw.get('bounding_shape', Collider.RECT))
         Movable.__init__(self, kw.get('position', (canvas[0] + 10,
                                       randint(50, canvas[1] - 50))))
-        GameObject.__init__(self, kw.get('priority', GameObject.Priority.NPC))
-        self.__sprite = Sprite(image, **kw)
+
+    def reset(self, canvas, image, **kw):
+        """Restart the enemy, when it is reused, keeping its sprite."""
+        self.restore()
+        self.should_collide = True
+        self.__start(canvas, **kw)
+        self.__sprite.restart()
         x, y, *_ = self.__sprite.bounds
         self.move(x, y)
 
@@ -29,8 +42,8 @@ class Enemy(Controllable, Collider, Movable, GameObject):
         """Update enemy position."""
         try:
             dx, dy = next(self.controller)
-            dx *= -1
-            self.move(dx, dy)
+            scale = self.step_scale()
+            self.move(-dx * scale, dy * scale)
             self.offlimits(bounds)
         except Exception as e:
             pass
@@ -40,7 +53,7 @@ class Enemy(Controllable, Collider, Movable, GameObject):
 
     def draw(self, screen):
         """Draw enemy on the screen."""
-        self.__sprite.draw(screen, self.position)
+        return self.__sprite.draw(screen, self.render_position)
 
     def offlimits(self, limits):
         """Take action when object is off-limits, return if needs update."""
@@ -68,6 +81,11 @@ class Enemy(Controllable, Collider, Movable, GameObject):
         """Return the sprite rotation."""
         return self.__sprite.rotation
 
+    @property
+    def mask(self):
+        """Return the sprite collision mask."""
+        return self.__sprite.mask
+
     @property
     def dimension(self):
         """Return the object dimension."""
@@ -83,12 +101,18 @@ class KillableEnemy(Enemy, Killable):
         Enemy.__init__(self, canvas, image, **kw)
         Killable.__init__(self, Explosion.SMALL, time_scale=0.5)
 
+    def reset(self, canvas, image, **kw):
+        """Restart the enemy, when it is reused, keeping its sprite."""
+        Enemy.reset(self, canvas, image, **kw)
+        Killable.respawn(self)
+        self.show()
+
     def draw(self, screen):
         """Draw enemy on the screen."""
         if self.should_update:
-            Enemy.draw(self, screen)
+            return Enemy.draw(self, screen)
         else:
-            Killable.draw(self, screen)
+            return Killable.draw(self, screen)
 
     def update(self, bounds):
         """Update enemy position."""
@@ -2,7 +2,7 @@
 
 from engine import GameObject, Sprite, Hideable
 
-import pygame
+from collections import defaultdict
 
 
 class Explosion(Hideable, GameObject):
@@ -10,24 +10,55 @@ class Explosion(Hideable, GameObject):
 
     BIG = "media/images/explosao.gif"
     SMALL = "media/images/explosion.gif"
+    # maximum number of finished explosions kept for reuse, of each kind.
+    POOL_SIZE = 32
+
+    # finished explosions, by (type, time_scale)
+    __pool = defaultdict(list)
+
+    @classmethod
+    def create(cls, position, type=SMALL, **kwargs):
+        """Return an explosion, reusing a finished one if possible."""
+        pool = cls.__pool[(type, kwargs.get('time_scale', 1.0))]
+        if pool:
+            explosion = pool.pop()
+            explosion.reset(position)
+            return explosion
+        return cls(position, type, **kwargs)
+
+    @classmethod
+    def release(cls, explosion):
+        """Keep a finished explosion for reuse."""
+        pool = cls.__pool[(explosion.__type, explosion.__time_scale)]
+        if len(pool) < cls.POOL_SIZE:
+            pool.append(explosion)
 
     def __init__(self, position, type=SMALL, **kwargs):
         """Initialize the object."""
         Hideable.__init__(self)
         GameObject.__init__(self, GameObject.Priority.DEFAULT)
-        ts = kwargs.get('time_scale', 1.0)
+        ts = self.__time_scale = kwargs.get('time_scale', 1.0)
+        self.__type = type
         self.__sprite = Sprite(type, animate=True, time_scale=ts, loop=True)
-        self.__ttl = self.__sprite.duration + pygame.time.get_ticks()
+        self.reset(position)
+        self.should_collide = False
+
+    def reset(self, position):
+        """Restart the explosion at the given position."""
+        self.show()
+        self.__sprite.restart()
+        # remaining time, in miliseconds of simulation.
+        self.__ttl = self.__sprite.duration
         _, _, w, h, *_ = list(map(lambda i: i // 2, self.__sprite.bounds))
         x, y = position
         self.__position = (x - w, y - h)
-        self.should_collide = False
 
     def update(self, bounds):
-        """Update object."""
-        if pygame.time.get_ticks() > self.__ttl:
+        """Update object, counting down its remaining time."""
+        self.__ttl -= self.step
+        if self.__ttl < 0:
             self.hide()
 
     def draw(self, screen):
         """Draw object."""
-        self.__sprite.draw(screen, self.__position)
+        return self.__sprite.draw(screen, self.__position)
@@ -32,18 +32,24 @@ class Killable(Hideable):
             if not self.__explosion.visible:
                 self.__dying = False
                 self.hide()
+                Explosion.release(self.__explosion)
+                self.__explosion = None
 
     def draw(self, screen):
         """Draw explosion."""
         if self.__dying:
-            self.__explosion.draw(screen)
+            return self.__explosion.draw(screen)
+        return []
 
     def die(self):
         """Mark object to die."""
         self.__dying = True
-        self.__explosion = Explosion(self.position, self.__type,
-                                     time_scale=self.__time_scale)
+        self.__explosion = Explosion.create(self.position, self.__type,
+                                            time_scale=self.__time_scale)
 
     def respawn(self):
-        """Respawn player."""
+        """Bring the object back to life."""
+        if self.__explosion is not None:
+            Explosion.release(self.__explosion)
+            self.__explosion = None
         self.__dying = False
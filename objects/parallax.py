@@ -0,0 +1,81 @@
+"""Creates a background with scrolling layers, with parallax effect."""
+
+from engine import GameObject
+from engine.assets import convert, get_image
+
+from random import randrange, choice
+import pygame
+
+
+class ParallaxBackground(GameObject):
+    """Define a background with layers scrolling at different speeds.
+
+    Every layer is rendered once, into a surface as wide as needed to cover
+    the canvas, which is drawn with at most two blits per frame, however
+    detailed the layer is.
+
+    Layers are given from the farthest to the nearest one, as dicts with:
+        - image: an image file, repeated to fill the layer, or
+        - stars: a dict with 'count', 'magnitudes' and 'colors' of stars
+          randomly placed in the layer;
+        - speed: pixels scrolled each frame (default: 1);
+        - y: the vertical position of the layer (default: 0);
+        - scale: the scale of the image (default: 1).
+    """
+
+    def __init__(self, canvas_size, layers):
+        """Render the background layers."""
+        GameObject.__init__(self, GameObject.Priority.BACKGROUND.value + 10)
+        self.__width, self.__height = canvas_size
+        # a layer is [surface, speed, y, offset]
+        self.__layers = [[self.__render(layer), layer.get('speed', 1),
+                          layer.get('y', 0), 0] for layer in layers]
+
+    def __render(self, layer):
+        """Render a layer surface."""
+        if 'image' in layer:
+            return self.__render_image(layer['image'], layer.get('scale', 1))
+        if 'stars' in layer:
+            return self.__render_stars(**layer['stars'])
+        raise Exception("Background layer must have 'image' or 'stars'.")
+
+    def __render_image(self, filename, scale):
+        """Render a layer repeating an image horizontally."""
+        tile = get_image(filename, scale)
+        width, height = tile.get_size()
+        count = -(-self.__width // width)
+        surface = pygame.Surface((count * width, height), pygame.SRCALPHA)
+        surface.blits([(tile, (x * width, 0)) for x in range(count)],
+                      doreturn=False)
+        return convert(surface)
+
+    def __render_stars(self, count=100, magnitudes=(1,), colors=(100,)):
+        """Render a layer of stars, that wraps around horizontally."""
+        surface = pygame.Surface((self.__width, self.__height))
+        for _ in range(count):
+            x, y = randrange(self.__width), randrange(self.__height)
+            magnitude, color = choice(magnitudes), (choice(colors),) * 3
+            for dx in (-self.__width, 0, self.__width):
+                pygame.draw.circle(surface, color, (x + dx, y), magnitude)
+        surface = convert(surface)
+        # run-length encoding skips the empty space quickly.
+        surface.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+        return surface
+
+    def update(self, bounds):
+        """Scroll the layers."""
+        for layer in self.__layers:
+            surface, speed, _, offset = layer
+            offset += speed * self.step_scale()
+            layer[3] = offset % surface.get_width()
+
+    def draw(self, screen):
+        """Draw the layers, from the farthest to the nearest."""
+        rects = []
+        for surface, _, y, offset in self.__layers:
+            x = -int(offset)
+            rects.append(screen.blit(surface, (x, y)))
+            x += surface.get_width()
+            if x < self.__width:
+                rects.append(screen.blit(surface, (x, y)))
+        return rects
@@ -40,7 +40,8 @@ class Player(Collider, Controllable, Movable, Killable, GameObject,
         if self.should_update:
             try:
                 mv = next(self.controller)
-                self.move(*list(map(lambda n: self.__speed * n, mv)))
+                speed = self.__speed * self.step_scale()
+                self.move(*list(map(lambda n: speed * n, mv)))
                 self.offlimits(bounds)
             except StopIteration as si:
                 pass
@@ -50,9 +51,9 @@ class Player(Collider, Controllable, Movable, Killable, GameObject,
     def draw(self, screen):
         """Draw enemy on the screen."""
         if self.should_update:
-            self.__sprite.draw(screen, self.position)
+            return self.__sprite.draw(screen, self.render_position)
         else:
-            Killable.draw(self, screen)
+            return Killable.draw(self, screen)
 
     def add_points(self, points):
         """Add points to player."""
@@ -19,10 +19,18 @@ class Projectile(Collider, Controllable, Movable, Hideable, GameObject):
     def __init__(self, creator, color, origin, direction, **kwargs):
         """Initialize the object."""
         Collider.__init__(self, Collider.LINE)
-        Controllable.__init__(self, direction)
-        Movable.__init__(self, origin)
         Hideable.__init__(self)
         GameObject.__init__(self, GameObject.Priority.PROJECTILE)
+        self.reset(creator, color, origin, direction, **kwargs)
+
+    def reset(self, creator, color, origin, direction, **kwargs):
+        """Restart the projectile, when it is reused."""
+        Controllable.__init__(self, direction)
+        Movable.__init__(self, origin)
+        self.moved()
+        self.show()
+        self.restore()
+        self.should_collide = True
         self.__size = kwargs.get("size", 8)
         self.__creator = type(creator)
         self.__color = color
@@ -32,7 +40,8 @@ class Projectile(Collider, Controllable, Movable, Hideable, GameObject):
     def update(self, bounds):
         """Update object."""
         self.__next = self.position
-        self.move(*map(lambda x: x * self.__size, next(self.controller)))
+        length = self.__size * self.step_scale()
+        self.move(*map(lambda x: x * length, next(self.controller)))
         x, _ = self.position
         _, _, w, _ = bounds
         if x > w:
@@ -42,8 +51,9 @@ class Projectile(Collider, Controllable, Movable, Hideable, GameObject):
         """Draw object on screen."""
         x, y = self.position
         if self.__next:
-            pygame.draw.line(screen, self.__color,
-                             list(self.position), list(self.__next), 4)
+            return pygame.draw.line(screen, self.__color,
+                                    list(self.position), list(self.__next), 4)
+        return []
 
     def collide_with(self, object):
         """Act on object collision."""
@@ -1,6 +1,6 @@
 """Models the game score."""
 
-from engine import GameObject, Label
+from engine import GameObject
 
 
 class Score(GameObject):
@@ -10,7 +10,7 @@ class Score(GameObject):
         """Initialize the game object."""
         GameObject.__init__(self, GameObject.Priority.BACKGROUND.value - 10)
         self.__position = position
-        self.__digits = [Label(font, str(i), (0, 0)) for i in range(10)]
+        self.__font = font
         self.__show_highscore = kwargs.get('highscore', False)
         self.restart()
 
@@ -22,14 +22,7 @@ class Score(GameObject):
         """Draw score to screen."""
         score = self.__highscore if self.__show_highscore else self.__score
         value = "{:0>8}".format(score)
-        x, y = self.__position
-        for n in value:
-            digit = self.__digits[int(n)]
-            rect = digit.bounds
-            rect.x = x
-            x += rect.width
-            digit.bounds = rect
-            digit.draw(screen)
+        return self.__font.draw(screen, value, self.__position)
 
     def toggle_score(self):
         """Toggle wich score to display."""
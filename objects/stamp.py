@@ -20,8 +20,7 @@ class Stamp(GameObject):
 
     def draw(self, screen):
         """Draw stamps."""
-        for stamp in self.__stamps:
-            screen.blit(self.__surface, stamp)
+        return [screen.blit(self.__surface, stamp) for stamp in self.__stamps]
 
     def stamp(self, positions, **kwargs):
         """Move label to the given position."""
@@ -1,36 +1,73 @@
 """Creates a 2D starfield, with parallax effect."""
 
 from engine import GameObject
+from engine.assets import convert
 
-from random import randrange, choice
+import random
+import numpy as np
 import pygame
 
 
 class Starfield(GameObject):
-    """Define a starfield background, with parallax."""
+    """Define a starfield background, with parallax.
 
-    def __create_star(self, x):
-        """Create a star for the background parallax."""
-        # a star is (x, y, speed, magnitude, color)
-        return [x, randrange(0, self.__height - 1), choice([2, 4, 6]),
-                choice([1, 2, 3]), (choice([100, 200, 250]),) * 3]
+    Stars are kept in arrays, one for each star attribute, and moved all at
+    once. Every star speed is a parallax layer, and every star is drawn
+    with a stamp, pre-rendered for each magnitude and color.
+    """
 
-    def __init__(self, canvas_size, count=300):
+    def __init__(self, canvas_size, count=300, speeds=(2, 4, 6),
+                 magnitudes=(1, 2, 3), colors=(100, 200, 250)):
         """Create the starfield stars."""
         GameObject.__init__(self, GameObject.Priority.BACKGROUND)
         self.__width, self.__height = canvas_size
-        self.__stars = [self.__create_star(randrange(0, self.__width - 1))
-                        for star in range(count)]
+        # stars are random, but reproducible with random.seed.
+        self.__random = np.random.RandomState(random.getrandbits(32))
+        self.__speeds = np.array(speeds)
+        self.__radius = np.array(magnitudes)
+        self.__colors = len(colors)
+        self.__stamps = np.empty(len(magnitudes) * len(colors), object)
+        self.__stamps[:] = [self.__create_stamp(magnitude, (gray,) * 3)
+                            for magnitude in magnitudes for gray in colors]
+        self.__x = self.__random.randint(0, self.__width - 1,
+                                         count).astype(float)
+        self.__y = np.empty(count, int)
+        self.__speed = np.empty(count, int)
+        self.__stamp = np.empty(count, int)
+        self.__create_stars(np.arange(count))
+
+    @staticmethod
+    def __create_stamp(magnitude, color):
+        """Create the image of a star."""
+        stamp = pygame.Surface((2 * magnitude, 2 * magnitude))
+        pygame.draw.circle(stamp, color, (magnitude, magnitude), magnitude)
+        stamp = convert(stamp)
+        stamp.set_colorkey((0, 0, 0))
+        return stamp
+
+    def __create_stars(self, index):
+        """Create new stars, at the given indexes, for the parallax."""
+        count = len(index)
+        choice = self.__random.randint
+        self.__y[index] = choice(0, self.__height - 1, count)
+        self.__speed[index] = self.__speeds[choice(0, len(self.__speeds),
+                                                   count)]
+        magnitude = choice(0, len(self.__radius), count)
+        color = choice(0, self.__colors, count)
+        self.__stamp[index] = magnitude * self.__colors + color
 
     def update(self, canvas_size):
         """Move the stars in the starfield."""
-        self.__stars = [[x - speed, y, speed, mag, color]
-                        if x - speed > 0
-                        else self.__create_star(self.__width)
-                        for x, y, speed, mag, color in self.__stars]
+        self.__x -= self.__speed * self.step_scale()
+        gone = np.flatnonzero(self.__x <= 0)
+        if len(gone):
+            self.__x[gone] = self.__width
+            self.__create_stars(gone)
 
     def draw(self, surface):
         """Draw the starfield in a screen."""
-        for x, y, _, magnitude, color in self.__stars:
-            # rect = (x, y, magnitude, magnitude)
-            pygame.draw.circle(surface, color, (x, y), magnitude)
+        radius = self.__radius[self.__stamp // self.__colors]
+        positions = zip((self.__x.astype(int) - radius).tolist(),
+                        (self.__y - radius).tolist())
+        return surface.blits(zip(self.__stamps[self.__stamp].tolist(),
+                                 positions))
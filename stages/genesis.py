@@ -8,7 +8,8 @@ Genesis = {
         "size": "minimum",
         "minimum": (800, 600),
         "maximum": (1920, 1080),
-        "fullscreen": False
+        "fullscreen": False,
+        "dirty_rects": True
     },
     "variables": {
         "score": {
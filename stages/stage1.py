@@ -27,6 +27,21 @@ def create_scene(game_config):
             "enemy_kill": {"filename": 'media/sound/laser.ogg'},
             "player_kill": {"filename": 'media/sound/mortar.ogg'},
         },
+        "assets": {
+            "images": ['media/images/f18.png', 'media/images/asteroid.png'],
+            "animations": [
+                ('media/images/ufo_spin.gif',
+                 {"shadow": ((30, 20), 0.8, 0.5)}),
+                ('media/images/explosion.gif', {"time_scale": 0.5}),
+                'media/images/explosao.gif',
+            ]
+        },
+        "collision": {
+            "broadphase": "grid",
+            "cell_size": 128,
+            "layers": ["player", "player_shot", "enemy", "enemy_shot",
+                       "obstacle"]
+        },
         "behaviors": {
             "sin_controller": {
                 "class": "engine.controllers.SinController",
@@ -76,6 +91,10 @@ def create_scene(game_config):
                     "controller": SceneBehavior('keyboard'),
                     "speed": config.player_speed
                 },
+                "collision": {
+                    "category": "player",
+                    "mask": ["enemy", "enemy_shot", "obstacle"]
+                },
                 "notifications": [
                     ("die", after, genesis.player_dead)
                 ]
@@ -89,12 +108,17 @@ def create_scene(game_config):
             },
             "projectile": {
                 "class": "objects.projectile.Projectile",
+                "pool": 64,
                 "init": {
                     "creator": SceneObject("player"),
                     "color": (255, 0, 255),
                     "origin": PropertyReference("player", "center"),
                     "direction": Direction.right,
                     "size": 12
+                },
+                "collision": {
+                    "category": "player_shot",
+                    "mask": ["enemy", "obstacle"]
                 }
             },
             "background": {
@@ -104,8 +128,21 @@ def create_scene(game_config):
                     "count": 300
                 }
             },
+            "distant_stars": {
+                "class": "objects.parallax.ParallaxBackground",
+                "init": {
+                    "canvas_size": canvas_size,
+                    "layers": [
+                        {"stars": {"count": 200, "colors": (40, 60)},
+                         "speed": 0.5},
+                        {"stars": {"count": 100, "colors": (70, 90)},
+                         "speed": 1}
+                    ]
+                }
+            },
             "ufo": {
                 "class": "objects.enemy.KillableEnemy",
+                "pool": 32,
                 "init": {
                     "canvas": canvas_size,
                     "image": 'media/images/ufo_spin.gif',
@@ -114,6 +151,10 @@ def create_scene(game_config):
                     "animate": True,
                     "shadow": ((30, 20), 0.8, 0.5),   # offset, scale, ambience
                     "bounding_shape": "ellipse",
+                },
+                "collision": {
+                    "category": "enemy",
+                    "mask": ["player", "player_shot"]
                 }
             },
             "asteroid": {
@@ -127,6 +168,10 @@ def create_scene(game_config):
                     "priority": GameObject.Priority.DEFAULT,
                     "rotate": RandomInt(0, 60),
                     "shadow": ((30, 20), 0.8, 0.5),   # offset, scale, ambience
+                },
+                "collision": {
+                    "category": "obstacle",
+                    "mask": ["player", "player_shot"]
                 }
             },
             "score": {
@@ -149,7 +194,8 @@ def create_scene(game_config):
             (8000, 1000, "call", genesis.enemy_shoot),
         ],
         "before": [
-            ("spawn", ["background", "player", "score", "life_stamp"]),
+            ("spawn", ["distant_stars", "background", "player", "score",
+                       "life_stamp"]),
             ("object", "player", "respawn"),
             ("object", "life_stamp", "stamp",
              [(280, 35), (360, 35), (440, 35)])